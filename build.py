@@ -10,6 +10,8 @@ from pathlib import Path
 
 from sphinx.application import Sphinx
 
+from pep_sphinx_extensions.artifacts import write_if_changed
+
 
 def create_parser():
     parser = argparse.ArgumentParser(description="Build PEP documents")
@@ -35,6 +37,17 @@ def create_parser():
         help="Output directory, relative to root. Default 'build'.",
     )
 
+    parser.add_argument(
+        "--slim-doctrees",
+        action="store_true",
+        help="Strip unused payload from cached doctrees, to save space and load time.",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Write precompressed .gz (and .zst) variants of text output files.",
+    )
+
     return parser.parse_args()
 
 
@@ -47,7 +60,7 @@ def create_index_file(html_root: Path, builder: str) -> None:
         return None
     if builder == "dirhtml":
         pep_zero_text = pep_zero_text.replace('="../', '="')  # remove relative directory links
-    html_root.joinpath("index.html").write_text(pep_zero_text, encoding="utf-8")
+    write_if_changed(html_root / "index.html", pep_zero_text.encode("utf-8"))
 
 
 if __name__ == "__main__":
@@ -70,6 +83,10 @@ if __name__ == "__main__":
         parallel=os.cpu_count() or 1,
         tags=["internal_builder"],
         keep_going=True,
+        confoverrides={
+            "pep_slim_doctrees": args.slim_doctrees,
+            "pep_precompress_output": args.precompress,
+        },
     )
     app.build()
 
@@ -81,4 +81,14 @@ resource "fastly_service_vcl" "peps" {
         }
     EOT
   }
+  snippet {
+    name    = "immutable-hashed-assets"
+    type    = "fetch"
+    content = <<-EOT
+        if (req.url.path ~ "^/_static/[\w-]+\.[0-9a-f]{10}\.(css|js)$" && beresp.status == 200) {
+          set beresp.http.Cache-Control = "public, max-age=31536000, immutable";
+          set beresp.ttl = 365d;
+        }
+    EOT
+  }
 }
@@ -9,15 +9,22 @@ from typing import TYPE_CHECKING, Any
 from docutils.writers.html5_polyglot import HTMLTranslator
 from sphinx import environment
 
+from pep_sphinx_extensions.artifacts import precompress_output
+from pep_sphinx_extensions.artifacts import write_manifest
+from pep_sphinx_extensions.artifacts import write_output_manifest
 from pep_sphinx_extensions.generate_rss import (
     create_rss_feed,
     get_from_doctree,
-    pep_abstract,
+    pep_metadata,
 )
+from pep_sphinx_extensions.metadata_store import STORE_NAME
+from pep_sphinx_extensions.metadata_store import close_metadata_stores
+from pep_sphinx_extensions.metadata_store import write_metadata_store
 from pep_sphinx_extensions.pep_processor.html import (
     pep_html_builder,
     pep_html_translator,
 )
+from pep_sphinx_extensions.pep_processor.html.pep_highlighter import CachedPygmentsBridge
 from pep_sphinx_extensions.pep_processor.parsing import (
     pep_banner_directive,
     pep_parser,
@@ -25,14 +32,19 @@ from pep_sphinx_extensions.pep_processor.parsing import (
 )
 from pep_sphinx_extensions.pep_processor.transforms import pep_footer
 from pep_sphinx_extensions.pep_processor.transforms import pep_references
+from pep_sphinx_extensions.pep_processor.transforms import pep_slim_doctree
 from pep_sphinx_extensions.pep_zero_generator.pep_index_generator import create_pep_zero
 
 if TYPE_CHECKING:
+    from docutils import nodes
     from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
 
 
 def _update_config_for_builder(app: Sphinx) -> None:
     app.env.document_ids = {}  # For PEPReferenceRoleTitleText
+    if not hasattr(app.env, "pep_metadata"):
+        app.env.pep_metadata = {}  # Headers and abstracts, kept between builds
     app.env.settings["builder"] = app.builder.name
     if app.builder.name == "dirhtml":
         app.env.settings["pep_url"] = "pep-{:0>4}/"
@@ -52,6 +64,41 @@ def _post_build(app: Sphinx, exception: Exception | None) -> None:
     if "internal_builder" not in app.tags:
         create_index_file(Path(app.outdir), app.builder.name)
     create_rss_feed(app.doctreedir, app.outdir)
+    close_metadata_stores()  # the feeds are the last readers
+    write_manifest(app.outdir)
+    if app.config.pep_precompress_output:
+        precompress_output(app.outdir, exclude=app.doctreedir, max_workers=app.parallel or None)
+    write_output_manifest(app.outdir, exclude=app.doctreedir)
+    if app.config.pep_slim_doctrees:
+        pep_slim_doctree.log_doctree_size(app.doctreedir)
+    if isinstance(app.builder, pep_html_builder.FileBuilder):
+        app.builder.record_write_stamp()
+    highlighter = getattr(app.builder, "highlighter", None)
+    if isinstance(highlighter, CachedPygmentsBridge):
+        highlighter.log_hit_rate()
+        # Incremental builds do not use the entries of unchanged pages
+        if getattr(app.builder, "writes_all_pages", False):
+            highlighter.prune_unused()
+
+
+def _collect_pep_metadata(app: Sphinx, doctree: nodes.document) -> None:
+    docname = app.env.docname
+    if docname.startswith("pep-") and "/" not in docname:
+        app.env.pep_metadata[docname] = pep_metadata(doctree)
+
+
+def _merge_pep_metadata(_app: Sphinx, env: BuildEnvironment, docnames: set[str], other: BuildEnvironment) -> None:
+    # Parallel reads collect metadata in each worker's environment
+    env.pep_metadata |= {docname: other.pep_metadata[docname] for docname in docnames if docname in other.pep_metadata}
+
+
+def _purge_pep_metadata(_app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    env.pep_metadata.pop(docname, None)
+
+
+def _write_pep_metadata(app: Sphinx, env: BuildEnvironment) -> None:
+    # Shared by all write workers and the feeds, see metadata_store.py
+    write_metadata_store(Path(app.doctreedir, STORE_NAME), env.pep_metadata)
 
 
 def set_description(
@@ -92,6 +139,16 @@ def setup(app: Sphinx) -> dict[str, bool]:
 
     app.add_post_transform(pep_references.PEPReferenceRoleTitleText)
 
+    # Strip unused payload from doctrees before pickling (opt-in)
+    app.add_config_value("pep_slim_doctrees", False, "env", bool)
+    app.add_transform(pep_slim_doctree.PEPSlimDoctree)
+
+    # Write .gz (and .zst) variants of text output files after the build (opt-in)
+    app.add_config_value("pep_precompress_output", False, "", bool)
+
+    # Persistent cache of highlighted code blocks, by default in the doctree directory
+    app.add_config_value("pep_highlight_cache_dir", "", "", str)
+
     # Register custom directives
     app.add_directive(
         "pep-banner", pep_banner_directive.PEPBanner)
@@ -109,6 +166,10 @@ def setup(app: Sphinx) -> dict[str, bool]:
     app.connect("builder-inited", _update_config_for_builder)  # Update configuration values for builder used
     app.connect("env-before-read-docs", create_pep_zero)  # PEP 0 hook
     app.connect('html-page-context', set_description)
+    app.connect("doctree-read", _collect_pep_metadata)
+    app.connect("env-merge-info", _merge_pep_metadata)
+    app.connect("env-purge-doc", _purge_pep_metadata)
+    app.connect("env-updated", _write_pep_metadata)
 
     # Mathematics rendering
     inline_maths = HTMLTranslator.visit_math, None
@@ -116,4 +177,5 @@ def setup(app: Sphinx) -> dict[str, bool]:
     app.add_html_math_renderer("maths_to_html", inline_maths, block_maths)  # Render maths to HTML
 
     # Parallel safety: https://www.sphinx-doc.org/en/master/extdev/index.html#extension-metadata
-    return {"parallel_read_safe": True, "parallel_write_safe": True}
+    # The environment version is bumped when the data stored in it changes
+    return {"parallel_read_safe": True, "parallel_write_safe": True, "env_version": 1}
@@ -0,0 +1,231 @@
+"""Write generated artifacts with minified, precompressed, and hashed variants."""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from release_management import write_if_changed
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+# Relative to the output directory
+MANIFEST_PATH = "api/manifest.json"
+OUTPUT_MANIFEST_PATH = "api/output-manifest.json"
+
+# Text files to precompress in the post-build stage
+PRECOMPRESS_SUFFIXES = frozenset({".atom", ".css", ".html", ".ics", ".js", ".json", ".rss", ".svg", ".txt", ".xml"})
+
+# SHA-256 digest and size of every artifact written in this build,
+# keyed by the path relative to the output directory
+_manifest: dict[str, dict[str, str | int]] = {}
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 keeps the gzip header (and so the file) reproducible
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _zstd(data: bytes) -> bytes:
+    return zstd.compress(data, level=19)
+
+
+# Precompressed variants, keyed by file suffix
+COMPRESSORS = {".gz": _gzip}
+if zstd is not None:
+    COMPRESSORS[".zst"] = _zstd
+
+# Suffixes of every precompressed variant, whether or not zstd is available
+VARIANT_SUFFIXES = frozenset({".gz", ".zst"})
+
+
+def write_artifact(output_dir: Path, name: str, content: str | bytes) -> None:
+    """Write an artifact with its precompressed siblings.
+
+    JSON artifacts also get a minified ``.min.json`` variant.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    files = {name: content}
+    if name.endswith(".json"):
+        minified = json.dumps(json.loads(content), ensure_ascii=False, separators=(",", ":"))
+        files[f"{name.removesuffix('.json')}.min.json"] = minified.encode("utf-8")
+
+    for file_name, data in files.items():
+        changed = write_if_changed(Path(output_dir, file_name), data)
+        _record_variants(output_dir, file_name, data, changed)
+
+
+def replace_artifact(output_dir: Path, name: str, source: Path, digest: str | None = None) -> None:
+    """Move a file streamed to disk into place as an artifact, with its precompressed siblings.
+
+    If the artifact already has the same contents, it is left untouched
+    and the source file is removed.
+    ``digest`` is the SHA-256 hex digest of the source, if it was hashed
+    while being written, so that an unchanged source is never read.
+    A source already in place (the artifact itself) is always treated as changed.
+    """
+    path = Path(output_dir, name)
+    source = Path(source)
+    if source == path:
+        _record_variants(output_dir, name, source.read_bytes(), changed=True)
+        return
+
+    if digest is None:
+        digest = _file_digest(source)
+    try:
+        changed = path.stat().st_size != source.stat().st_size or _file_digest(path) != digest
+    except FileNotFoundError:
+        changed = True
+    if changed:
+        os.replace(source, path)
+    else:
+        source.unlink()
+
+    variant_paths = [path.with_name(path.name + suffix) for suffix in COMPRESSORS]
+    if changed or not all(variant_path.is_file() for variant_path in variant_paths):
+        # Read once, to compress
+        _record_variants(output_dir, name, path.read_bytes(), changed)
+    else:
+        _manifest[name] = {"sha256": digest, "size": path.stat().st_size}
+        for variant_path in variant_paths:
+            _record(variant_path.relative_to(output_dir).as_posix(), variant_path.read_bytes())
+
+
+def _file_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _record_variants(output_dir: Path, name: str, data: bytes, changed: bool) -> None:
+    """Record an artifact, writing its precompressed variants if it changed or they are missing."""
+    path = Path(output_dir, name)
+    _record(name, data)
+    for suffix, compress in COMPRESSORS.items():
+        variant_path = path.with_name(path.name + suffix)
+        if changed or not variant_path.is_file():
+            compressed = compress(data)
+            variant_path.write_bytes(compressed)
+        else:
+            # Unchanged artifact, don't recompress
+            compressed = variant_path.read_bytes()
+        _record(name + suffix, compressed)
+
+
+def _record(name: str, data: bytes) -> None:
+    _manifest[name] = {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data)}
+
+
+def manifest_snapshot() -> dict[str, dict[str, str | int]]:
+    """Return a copy of the artifacts recorded so far, for ``recorded_since``."""
+    return dict(_manifest)
+
+
+def recorded_since(snapshot: dict[str, dict[str, str | int]]) -> list[str]:
+    """Return the names of the artifacts recorded since the snapshot was taken.
+
+    Artifacts recorded again with the same contents are included.
+    """
+    return sorted(name for name, entry in _manifest.items() if snapshot.get(name) is not entry)
+
+
+def write_manifest(output_dir: Path) -> None:
+    """Write the content-hash manifest of artifacts, for use as ETags."""
+    manifest_path = Path(output_dir, MANIFEST_PATH)
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    # Keep entries for artifacts not regenerated in this build, if they still exist
+    manifest = {name: entry for name, entry in manifest.items() if Path(output_dir, name).is_file()}
+    manifest |= _manifest
+    output = json.dumps(dict(sorted(manifest.items())), indent=1)
+    write_if_changed(manifest_path, output.encode("utf-8"))
+
+
+def precompress_output(output_dir: Path, exclude: Path | None = None, max_workers: int | None = None) -> int:
+    """Write precompressed variants of every text file in the output directory.
+
+    Files with the same digest as in the previous build's output manifest,
+    and which already have all their variants, are skipped,
+    as are artifacts already compressed by ``write_artifact``.
+    Variants whose source file no longer exists are removed.
+    Returns the number of files compressed.
+    """
+    output_dir = Path(output_dir)
+    try:
+        manifest = json.loads(Path(output_dir, OUTPUT_MANIFEST_PATH).read_text(encoding="utf-8"))
+        previous = manifest["files"]
+    except (FileNotFoundError, ValueError, KeyError):
+        previous = {}
+
+    to_compress = []
+    for path in list(output_dir.rglob("*")):
+        if exclude is not None and path.is_relative_to(exclude):
+            continue
+        if path.suffix in VARIANT_SUFFIXES:
+            source = path.with_suffix("")
+            if source.suffix in PRECOMPRESS_SUFFIXES and not source.exists():
+                path.unlink()  # orphaned by a source deleted since the last build
+            continue
+        if path.suffix not in PRECOMPRESS_SUFFIXES or not path.is_file():
+            continue
+        name = path.relative_to(output_dir).as_posix()
+        if name in _manifest or name == OUTPUT_MANIFEST_PATH:
+            continue
+        variants_exist = all(path.with_name(path.name + suffix).is_file() for suffix in COMPRESSORS)
+        if variants_exist and previous.get(name) == hashlib.sha256(path.read_bytes()).hexdigest():
+            continue
+        to_compress.append(path)
+
+    if len(to_compress) > 1:
+        with ProcessPoolExecutor(max_workers) as executor:
+            for _ in executor.map(_compress_file, to_compress, chunksize=16):
+                pass
+    elif to_compress:
+        _compress_file(to_compress[0])
+    return len(to_compress)
+
+
+def _compress_file(path: Path) -> None:
+    data = path.read_bytes()
+    for suffix, compress in COMPRESSORS.items():
+        write_if_changed(path.with_name(path.name + suffix), compress(data))
+
+
+def write_output_manifest(output_dir: Path, exclude: Path | None = None) -> None:
+    """Write the SHA-256 digest of every output file, and which have changed.
+
+    Changes are relative to the manifest from the previous build, if present,
+    so that deployments and CDN purges can act only on changed paths.
+    Files under ``exclude`` (e.g. the doctree cache) are not listed.
+    """
+    output_dir = Path(output_dir)
+    manifest_path = output_dir / OUTPUT_MANIFEST_PATH
+    try:
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))["files"]
+    except (FileNotFoundError, ValueError, KeyError):
+        previous = {}
+
+    files = {}
+    for path in sorted(output_dir.rglob("*")):
+        if path == manifest_path or not path.is_file():
+            continue
+        if exclude is not None and path.is_relative_to(exclude):
+            continue
+        files[path.relative_to(output_dir).as_posix()] = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    manifest = {
+        "changed": [name for name, digest in files.items() if previous.get(name) != digest],
+        "removed": sorted(previous.keys() - files.keys()),
+        "files": files,
+    }
+    write_if_changed(manifest_path, json.dumps(manifest, indent=1).encode("utf-8"))
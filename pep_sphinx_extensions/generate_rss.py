@@ -3,26 +3,47 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+import dataclasses
 import datetime as dt
-import pickle
 from email.utils import format_datetime, getaddresses
+import hashlib
 from html import escape
+import itertools
+import json
 from pathlib import Path
+import pickle
+from typing import Any
 
 from docutils import nodes
 
+from pep_sphinx_extensions.artifacts import replace_artifact
+from pep_sphinx_extensions.metadata_store import open_metadata_store
+from pep_sphinx_extensions.pep_processor.transforms import pep_footer
+from pep_sphinx_extensions.pep_zero_generator.constants import SUBINDICES_BY_TOPIC
+from release_management import source_date
+
 RSS_DESCRIPTION = (
     "Newest Python Enhancement Proposals (PEPs): "
     "Information on new language features "
     "and some meta-information like release procedure and schedules."
 )
 
+# Number of items in each feed
+FEED_LENGTH = 10
+# Number of items in the recently modified feed, polled by mirrors
+MODIFIED_FEED_LENGTH = 50
+
 
 def _format_rfc_2822(datetime: dt.datetime) -> str:
     datetime = datetime.replace(tzinfo=dt.timezone.utc)
     return format_datetime(datetime, usegmt=True)
 
 
+def _format_rfc_3339(datetime: dt.datetime) -> str:
+    return datetime.replace(tzinfo=dt.timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 document_cache: dict[Path, dict[str, str]] = {}
 
 
@@ -31,16 +52,23 @@ def get_from_doctree(full_path: Path, text: str) -> str:
     if full_path in document_cache:
         return document_cache[full_path].get(text, "")
 
+    # Else try the metadata store written after the read phase
+    store = open_metadata_store(full_path.parent)
+    if store is not None and full_path.stem in store:
+        return store[full_path.stem].get(text, "")
+
     # Else load doctree
     document = pickle.loads(full_path.read_bytes())
-    # Store the headers (populated in the PEPHeaders transform)
-    document_cache[full_path] = path_cache = document.get("headers", {})
-    # Store the Abstract
-    path_cache["Abstract"] = pep_abstract(document)
+    document_cache[full_path] = path_cache = pep_metadata(document)
     # Return the requested key
     return path_cache.get(text, "")
 
 
+def pep_metadata(document: nodes.document) -> dict[str, str]:
+    """Return the headers (populated in the PEPHeaders transform) and the abstract of a PEP."""
+    return {**document.get("headers", {}), "Abstract": pep_abstract(document)}
+
+
 def pep_creation(full_path: Path) -> dt.datetime:
     created_str = get_from_doctree(full_path, "Created")
     try:
@@ -69,58 +97,266 @@ def pep_abstract(document: nodes.document) -> str:
     return introduction
 
 
-def _generate_items(doctree_dir: Path):
-    # get list of peps with creation time (from "Created:" string in pep source)
+def _pep_details(full_path: Path) -> dict[str, Any] | None:
+    """Return the feed metadata for a PEP, read from its doctree."""
+    try:
+        pep_num = int(get_from_doctree(full_path, "PEP"))
+    except ValueError:
+        return None
+
+    author = get_from_doctree(full_path, "Author")
+    if "@" in author or " at " in author:
+        parsed_authors = getaddresses([author])
+        joined_authors = ", ".join(f"{name} ({email_address})" for name, email_address in parsed_authors)
+    else:
+        joined_authors = author
+
+    return {
+        "number": pep_num,
+        "title": get_from_doctree(full_path, "Title"),
+        "url": f"https://peps.python.org/pep-{pep_num:0>4}/",
+        "abstract": get_from_doctree(full_path, "Abstract"),
+        "author": joined_authors,
+        "created": pep_creation(full_path),
+        "topics": {topic.strip().lower() for topic in get_from_doctree(full_path, "Topic").split(",")},
+    }
+
+
+def _collect_peps(doctree_dir: Path) -> list[dict[str, Any]]:
+    """Read the metadata of all PEPs, newest first by creation date."""
     peps_with_dt = sorted((pep_creation(path), path) for path in doctree_dir.glob("pep-????.doctree"))
+    peps = (_pep_details(full_path) for _, full_path in reversed(peps_with_dt))
+    return [pep for pep in peps if pep is not None]
+
+
+@dataclasses.dataclass(frozen=True)
+class FeedItem:
+    title: str
+    url: str
+    summary: str
+    author: str
+    published: dt.datetime
+    id: str  # the URL for items that link to their own page
+
+
+@dataclasses.dataclass(frozen=True)
+class Feed:
+    name: str  # output path without the suffix, relative to the output directory
+    title: str
+    link: str
+    description: str
+    items: list[FeedItem]
+
 
-    # generate rss items for 10 most recent peps (in reverse order)
-    for datetime, full_path in reversed(peps_with_dt[-10:]):
-        try:
-            pep_num = int(get_from_doctree(full_path, "PEP"))
-        except ValueError:
+def _pep_items(peps: Iterable[dict[str, Any]]) -> list[FeedItem]:
+    # generate items for the most recent peps
+    return [
+        FeedItem(
+            f"PEP {pep['number']}: {pep['title']}", pep["url"], pep["abstract"], pep["author"], pep["created"], pep["url"]
+        )
+        for pep in itertools.islice(peps, FEED_LENGTH)
+    ]
+
+
+def _status_items(peps: list[dict[str, Any]], output_dir: Path) -> list[FeedItem]:
+    # generate items for the most recent status changes, from peps-changes.json
+    try:
+        changes = json.loads(Path(output_dir, "api", "peps-changes.json").read_text(encoding="utf-8"))["changes"]
+    except (FileNotFoundError, ValueError, KeyError):
+        changes = []
+    peps_by_number = {pep["number"]: pep for pep in peps}
+
+    status_changes = (
+        (change["date"], int(number), fields["status"])
+        for change in changes
+        for number, fields in change["changed"].items()
+        if "status" in fields
+    )
+    items = []
+    for date, pep_num, status in itertools.islice(status_changes, FEED_LENGTH):
+        pep = peps_by_number.get(pep_num)
+        if pep is None:
             continue
+        items.append(FeedItem(
+            f"PEP {pep_num}: {pep['title']} ({status['old']} → {status['new']})",
+            pep["url"],
+            f"Status changed from {status['old']} to {status['new']}.",
+            pep["author"],
+            dt.datetime.fromisoformat(date),
+            f"tag:peps.python.org,{date[:10]}:pep-{pep_num:0>4}-{status['new'].lower()}",
+        ))
+    return items
 
-        title = get_from_doctree(full_path, "Title")
-        url = f"https://peps.python.org/pep-{pep_num:0>4}/"
-        abstract = get_from_doctree(full_path, "Abstract")
-        author = get_from_doctree(full_path, "Author")
-        if "@" in author or " at " in author:
-            parsed_authors = getaddresses([author])
-            joined_authors = ", ".join(f"{name} ({email_address})" for name, email_address in parsed_authors)
-        else:
-            joined_authors = author
-
-        item = f"""\
-    <item>
-      <title>PEP {pep_num}: {escape(title, quote=False)}</title>
-      <link>{escape(url, quote=False)}</link>
-      <description>{escape(abstract, quote=False)}</description>
-      <author>{escape(joined_authors, quote=False)}</author>
-      <guid isPermaLink="true">{url}</guid>
-      <pubDate>{_format_rfc_2822(datetime)}</pubDate>
-    </item>"""
-        yield item
 
+def _modified_items(peps: list[dict[str, Any]]) -> list[FeedItem]:
+    # generate items for the most recently modified peps, from the git timestamps used in page footers
+    peps_by_stem = {f"pep-{pep['number']:0>4}": pep for pep in peps}
+    items = []
+    for stem, iso_time in pep_footer.get_recently_modified(MODIFIED_FEED_LENGTH):
+        pep = peps_by_stem.get(stem)
+        if pep is None:
+            continue
+        modified = dt.datetime.strptime(iso_time, "%Y-%m-%d %H:%M:%S")
+        items.append(FeedItem(
+            f"PEP {pep['number']}: {pep['title']}",
+            pep["url"],
+            f"Last modified {iso_time} UTC.",  # not the abstract, to keep the feed small for polling
+            pep["author"],
+            modified,
+            f"tag:peps.python.org,{iso_time[:10]}:{stem}-{modified:%H%M%S}",
+        ))
+    return items
 
-def create_rss_feed(doctree_dir: Path, output_dir: Path):
-    # The rss envelope
-    last_build_date = _format_rfc_2822(dt.datetime.now(dt.timezone.utc))
-    items = "\n".join(_generate_items(Path(doctree_dir)))
-    output = f"""\
+
+def build_feeds(doctree_dir: Path, output_dir: Path) -> list[Feed]:
+    """Build the model of all feeds, reading the metadata of all PEPs once."""
+    peps = _collect_peps(Path(doctree_dir))
+
+    feeds = [Feed("peps", "Newest Python PEPs", "https://peps.python.org/", RSS_DESCRIPTION, _pep_items(peps))]
+    for topic in SUBINDICES_BY_TOPIC:
+        feeds.append(Feed(
+            f"topic/{topic}",
+            f"Newest {topic.title()} PEPs",
+            f"https://peps.python.org/topic/{topic}/",
+            f"Newest Python Enhancement Proposals (PEPs) with the {topic.title()} topic.",
+            _pep_items(pep for pep in peps if topic in pep["topics"]),
+        ))
+    feeds.append(Feed(
+        "peps-updated",
+        "Recently modified Python PEPs",
+        "https://peps.python.org/",
+        "The most recently modified Python Enhancement Proposals (PEPs), by their last commit.",
+        _modified_items(peps),
+    ))
+    feeds.append(Feed(
+        "peps-status",
+        "Python PEP status changes",
+        "https://peps.python.org/",
+        "Recent status changes of Python Enhancement Proposals (PEPs), such as acceptance or rejection.",
+        _status_items(peps, Path(output_dir)),
+    ))
+    return feeds
+
+
+def _updated(feed: Feed) -> dt.datetime:
+    # The newest item's date, so that the output only changes with its items
+    return max((item.published for item in feed.items), default=dt.datetime(1970, 1, 1))
+
+
+def _text(text: str) -> str:
+    return escape(text, quote=False)
+
+
+def serialise_rss(feed: Feed, build_date: dt.datetime) -> Iterator[str]:
+    """Render a feed as RSS 2.0."""
+    yield f"""\
 <?xml version='1.0' encoding='UTF-8'?>
 <rss xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">
   <channel>
-    <title>Newest Python PEPs</title>
-    <link>https://peps.python.org/</link>
-    <description>{RSS_DESCRIPTION}</description>
-    <atom:link href="https://peps.python.org/peps.rss" rel="self"/>
+    <title>{_text(feed.title)}</title>
+    <link>{feed.link}</link>
+    <description>{_text(feed.description)}</description>
+    <atom:link href="https://peps.python.org/{feed.name}.rss" rel="self"/>
     <docs>https://cyber.harvard.edu/rss/rss.html</docs>
     <language>en</language>
-    <lastBuildDate>{last_build_date}</lastBuildDate>
-{items}
+    <lastBuildDate>{_format_rfc_2822(build_date)}</lastBuildDate>
+"""
+    for item in feed.items:
+        is_permalink = "true" if item.id == item.url else "false"
+        yield f"""\
+    <item>
+      <title>{_text(item.title)}</title>
+      <link>{_text(item.url)}</link>
+      <description>{_text(item.summary)}</description>
+      <author>{_text(item.author)}</author>
+      <guid isPermaLink="{is_permalink}">{_text(item.id)}</guid>
+      <pubDate>{_format_rfc_2822(item.published)}</pubDate>
+    </item>
+"""
+    yield """\
   </channel>
 </rss>
 """
 
-    # output directory for target HTML files
-    Path(output_dir, "peps.rss").write_text(output, encoding="utf-8")
+
+def serialise_atom(feed: Feed, _build_date: dt.datetime) -> Iterator[str]:
+    """Render a feed as Atom (RFC 4287)."""
+    self_url = f"https://peps.python.org/{feed.name}.atom"
+    yield f"""\
+<?xml version='1.0' encoding='UTF-8'?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="en">
+  <id>{self_url}</id>
+  <title>{_text(feed.title)}</title>
+  <subtitle>{_text(feed.description)}</subtitle>
+  <link href="{feed.link}"/>
+  <link href="{self_url}" rel="self"/>
+  <updated>{_format_rfc_3339(_updated(feed))}</updated>
+"""
+    for item in feed.items:
+        yield f"""\
+  <entry>
+    <id>{_text(item.id)}</id>
+    <title>{_text(item.title)}</title>
+    <link href="{escape(item.url)}"/>
+    <summary>{_text(item.summary)}</summary>
+    <author><name>{_text(item.author)}</name></author>
+    <published>{_format_rfc_3339(item.published)}</published>
+    <updated>{_format_rfc_3339(item.published)}</updated>
+  </entry>
+"""
+    yield "</feed>\n"
+
+
+def serialise_json_feed(feed: Feed, _build_date: dt.datetime) -> Iterator[str]:
+    """Render a feed as JSON Feed 1.1."""
+    header = json.dumps({
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": feed.title,
+        "home_page_url": feed.link,
+        "feed_url": f"https://peps.python.org/{feed.name}.feed.json",
+        "description": feed.description,
+        "language": "en",
+    }, ensure_ascii=False, indent=1)
+    yield header.removesuffix("\n}") + ',\n "items": ['
+    for i, item in enumerate(feed.items):
+        entry = {
+            "id": item.id,
+            "url": item.url,
+            "title": item.title,
+            "summary": item.summary,
+            "date_published": _format_rfc_3339(item.published),
+            "authors": [{"name": item.author}],
+        }
+        yield ("," if i else "") + "\n  " + json.dumps(entry, ensure_ascii=False)
+    yield "\n ]\n}\n"
+
+
+# Serialisers, keyed by file suffix
+SERIALISERS = {
+    ".rss": serialise_rss,
+    ".atom": serialise_atom,
+    ".feed.json": serialise_json_feed,
+}
+
+
+def _write_feed(output_dir: Path, name: str, chunks: Iterable[str]) -> None:
+    path = Path(output_dir, name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.tmp")
+    digest = hashlib.sha256()
+    with temp_path.open("wb") as f:
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            f.write(data)
+            digest.update(data)
+    # The feed is only replaced if it changed, which with a stable build date
+    # (see source_date) is only when its items change
+    replace_artifact(output_dir, name, temp_path, digest.hexdigest())
+
+
+def create_rss_feed(doctree_dir: Path, output_dir: Path):
+    """Write every feed in every format, from a single model of the feeds."""
+    build_date = source_date()
+    for feed in build_feeds(doctree_dir, output_dir):
+        for suffix, serialise in SERIALISERS.items():
+            _write_feed(output_dir, feed.name + suffix, serialise(feed, build_date))
@@ -0,0 +1,113 @@
+"""A read-only, memory-mapped store of PEP headers and abstracts.
+
+The store is written once after the read phase, and opened by the write
+workers and the feed generator, so that each process reads shared pages
+from the operating system's file cache rather than unpickling doctrees.
+
+The file layout is an 8-byte little-endian index length, a JSON index of
+``{docname: [offset, length]}``, and then the JSON record of each document.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+import json
+import mmap
+import os
+from pathlib import Path
+import struct
+
+# Relative to the doctree directory
+STORE_NAME = "pep-metadata.store"
+
+_INDEX_LENGTH = struct.Struct("<Q")
+
+
+def write_metadata_store(path: Path, metadata: Mapping[str, dict[str, str]]) -> bool:
+    """Write the store of metadata records, keyed by docname.
+
+    Returns whether the file was written.
+    """
+    index = {}
+    records = []
+    offset = 0
+    for docname in sorted(metadata):
+        record = json.dumps(metadata[docname], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        index[docname] = [offset, len(record)]
+        records.append(record)
+        offset += len(record)
+
+    index_data = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    data = b"".join([_INDEX_LENGTH.pack(len(index_data)), index_data, *records])
+    try:
+        if Path(path).read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    # Replace atomically, as other processes may have the old store mapped
+    temp_path = Path(path).with_name(f"{Path(path).name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+    return True
+
+
+class MetadataStore(Mapping[str, dict[str, str]]):
+    """Read-only mapping of docnames to metadata records, backed by ``mmap``."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self.file_id = _file_id(os.fstat(f.fileno()))
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (index_length,) = _INDEX_LENGTH.unpack_from(self._map)
+        self._start = _INDEX_LENGTH.size + index_length
+        self._index: dict[str, list[int]] = json.loads(self._map[_INDEX_LENGTH.size:self._start])
+
+    def __getitem__(self, docname: str) -> dict[str, str]:
+        offset, length = self._index[docname]
+        start = self._start + offset
+        return json.loads(self._map[start:start + length])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        self._map.close()
+
+
+# Open stores, keyed by doctree directory
+_stores: dict[Path, MetadataStore] = {}
+
+
+def open_metadata_store(doctree_dir: Path) -> MetadataStore | None:
+    """Return the store in the doctree directory, if there is one.
+
+    Stores are opened once per process,
+    and reopened if the file was replaced by a later build.
+    """
+    path = Path(doctree_dir, STORE_NAME)
+    try:
+        file_id = _file_id(path.stat())
+    except FileNotFoundError:
+        return None
+    store = _stores.get(path.parent)
+    if store is None or store.file_id != file_id:
+        if store is not None:
+            store.close()
+        store = _stores[path.parent] = MetadataStore(path)
+    return store
+
+
+def close_metadata_stores() -> None:
+    """Close the stores opened by this process, e.g. at the end of a build."""
+    while _stores:
+        _stores.popitem()[1].close()
+
+
+def _file_id(stat_result: os.stat_result) -> tuple[int, int]:
+    # a replaced file has a new inode, even within the mtime resolution
+    return stat_result.st_ino, stat_result.st_mtime_ns
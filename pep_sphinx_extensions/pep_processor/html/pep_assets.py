@@ -0,0 +1,212 @@
+"""Bundle, minify, and content-hash the theme's static assets."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+import re
+
+from pep_sphinx_extensions.artifacts import write_if_changed
+
+# Theme files loaded on every page, concatenated in this order
+BUNDLES = {
+    "pep.css": ("style.css", "mq.css"),
+    "pep.js": ("colour_scheme.js", "sticky_banner.js"),
+}
+# Theme files loaded on some pages only, hashed but not bundled
+STANDALONE = ("pep_version_filter.js",)
+
+# Length of the content hash in file names, e.g. ``pep.0123456789.css``
+HASH_LENGTH = 10
+
+# Strings are kept verbatim, and comments removed, in a single left-to-right
+# pass, so that neither is mistaken for the start of the other
+CSS_STRING_OR_COMMENT = re.compile(r"""("(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')|/\*.*?\*/""", re.DOTALL)
+CSS_CHARSET = re.compile(r'\A\s*@charset "[^"]*";\s*')
+CSS_WHITESPACE = re.compile(r"\s+")
+# Only in declarations with a value, as the space before a colon in
+# selectors, and in "--var: ;" space toggles, is significant
+CSS_DECLARATION_COLON = re.compile(r"\s*:\s*(?=[^\s{};][^{};]*[;}])")
+CSS_PUNCTUATION = re.compile(r"(?<!:)\s*([{};,])\s*")  # keep "--var: ;" space toggles
+
+# Code between comments, strings, template literals, and regular expressions
+JS_CODE = re.compile(r"[^/'\"`]+")
+JS_WORD_END = re.compile(r"[\w$]+\Z")
+# Keywords after which a slash starts a regular expression
+JS_KEYWORDS_BEFORE_EXPRESSION = frozenset(
+    {"await", "case", "delete", "do", "else", "in", "instanceof", "new", "of", "return", "throw", "typeof", "void", "yield"}
+)
+
+# Hidden strings and other literals, see minify_css() and minify_js()
+PLACEHOLDER = re.compile(r"\0(\d+)\0")
+
+
+def minify_css(text: str) -> str:
+    """Remove comments and redundant whitespace from a stylesheet."""
+    text = CSS_CHARSET.sub("", text)
+    strings = []
+
+    def _hide_string(match: re.Match[str]) -> str:
+        if match[1] is None:
+            return ""  # comment
+        strings.append(match[1])
+        return f"\0{len(strings) - 1}\0"
+
+    text = CSS_STRING_OR_COMMENT.sub(_hide_string, text)
+    text = CSS_WHITESPACE.sub(" ", text)
+    text = CSS_DECLARATION_COLON.sub(":", text)
+    text = CSS_PUNCTUATION.sub(r"\1", text)
+    text = text.replace(";}", "}").strip()
+    return PLACEHOLDER.sub(lambda match: strings[int(match[1])], text)
+
+
+def minify_js(text: str) -> str:
+    """Remove comments, indentation, and blank lines from a script.
+
+    Strings, template literals, and regular expressions are kept verbatim.
+    This is deliberately conservative, as the scripts rely on automatic
+    semicolon insertion: line breaks between lines of code are kept.
+    """
+    code = []
+    literals = []
+    pos = 0
+    while pos < len(text):
+        if match := JS_CODE.match(text, pos):
+            code.append(match[0])
+            pos = match.end()
+        elif text.startswith("//", pos):
+            end = text.find("\n", pos)
+            pos = len(text) if end == -1 else end
+        elif text.startswith("/*", pos):
+            end = text.find("*/", pos + 2)
+            end = len(text) if end == -1 else end + 2
+            # A comment with a line break counts as one for semicolon insertion,
+            # and any other comment as a space
+            if "\n" in text[pos:end]:
+                code.append("\n")
+            elif not (text[end : end + 1].isspace() or code and code[-1][-1].isspace()):
+                code.append(" ")
+            pos = end
+        elif text[pos] == "/" and not _js_regex_allowed(code):
+            code.append("/")  # division
+            pos += 1
+        elif (end := _js_literal_end(text, pos)) is None:
+            code.append(text[pos])  # not a regular expression after all
+            pos += 1
+        else:
+            literals.append(text[pos:end])
+            code.append(f"\0{len(literals) - 1}\0")
+            pos = end
+    lines = (line.strip() for line in "".join(code).splitlines())
+    text = "\n".join(line for line in lines if line)
+    return PLACEHOLDER.sub(lambda match: literals[int(match[1])], text)
+
+
+def _js_regex_allowed(code: list[str]) -> bool:
+    # A slash starts a regular expression after punctuation, an operator,
+    # or a keyword, and is a division after a value
+    previous = next((part.rstrip() for part in reversed(code) if part.strip()), "")
+    if not previous:
+        return True
+    if previous[-1] in ")]\0":
+        return False
+    if word := JS_WORD_END.search(previous):
+        return word[0] in JS_KEYWORDS_BEFORE_EXPRESSION
+    return True
+
+
+def _js_literal_end(text: str, start: int) -> int | None:
+    # The end of the string, template literal, or regular expression at start,
+    # or None for a slash that cannot start a regular expression
+    quote = text[start]
+    pos = start + 1
+    in_class = False
+    while pos < len(text):
+        char = text[pos]
+        if char == "\\":
+            pos += 2
+            continue
+        if quote == "`":
+            if text.startswith("${", pos):
+                pos = _js_substitution_end(text, pos + 2)
+                continue
+        elif char == "\n":
+            return None if quote == "/" else pos
+        if quote == "/" and char == "[":
+            in_class = True
+        elif quote == "/" and char == "]":
+            in_class = False
+        elif char == quote and not in_class:
+            return pos + 1
+        pos += 1
+    return None if quote == "/" else len(text)
+
+
+def _js_substitution_end(text: str, pos: int) -> int:
+    # The end of a template literal's ``${...}`` substitution
+    depth = 1
+    while pos < len(text):
+        char = text[pos]
+        if char in "'\"`":
+            pos = _js_literal_end(text, pos)
+            continue
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if not depth:
+                return pos + 1
+        pos += 1
+    return len(text)
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    """Add the content hash of data to a file name."""
+    stem, _, suffix = name.rpartition(".")
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}.{suffix}"
+
+
+def _minify(name: str, text: str) -> str:
+    return minify_css(text) if name.endswith(".css") else minify_js(text)
+
+
+def write_theme_assets(static_dir: Path, output_dir: Path, generated: dict[str, str]) -> dict[str, str]:
+    """Write the bundled and minified theme assets, with hashed names.
+
+    ``generated`` maps the names of generated stylesheets (the Pygments
+    styles) to their contents.
+    Returns a map of asset names to output paths, such as
+    ``{"pep.css": "_static/pep.0123456789.css"}``, for use in templates.
+    """
+    assets = {}
+    for name, sources in BUNDLES.items():
+        parts = [_minify(name, Path(static_dir, source).read_text(encoding="utf-8")) for source in sources]
+        if name.endswith(".css"):
+            assets[name] = '@charset "UTF-8";' + "".join(parts)
+        else:
+            # Scripts are classic (not module) scripts, so top-level
+            # names remain global, as the template's event handlers expect
+            assets[name] = "\n;\n".join(parts)
+    for name in STANDALONE:
+        assets[name] = _minify(name, Path(static_dir, name).read_text(encoding="utf-8"))
+    for name, text in generated.items():
+        assets[name] = _minify(name, text)
+
+    paths = {}
+    for name, text in assets.items():
+        data = text.encode("utf-8")
+        path = f"_static/{hashed_name(name, data)}"
+        write_if_changed(Path(output_dir, path), data)
+        _remove_stale(Path(output_dir, path), name)
+        paths[name] = path
+    return paths
+
+
+def _remove_stale(current: Path, name: str) -> None:
+    # Remove the hashed files (and their precompressed variants)
+    # written for earlier contents of the asset
+    stem, _, suffix = name.rpartition(".")
+    stale = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}\.{re.escape(suffix)}(?:\.gz|\.zst)?")
+    for path in current.parent.iterdir():
+        if stale.fullmatch(path.name) and not path.name.startswith(current.name):
+            path.unlink()
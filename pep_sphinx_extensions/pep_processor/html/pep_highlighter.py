@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+from pathlib import Path
+from typing import Any
+
+import pygments
+import sphinx
+from sphinx import highlighting
+from sphinx.util import logging as sphinx_logging
+
+logger = sphinx_logging.getLogger(__name__)
+
+
+class _WarningRecorder(logging.Filter):
+    """Note whether any warnings were logged."""
+
+    def __init__(self):
+        super().__init__()
+        self.warned = False
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            self.warned = True
+        return True
+
+
+class CachedPygmentsBridge(highlighting.PygmentsBridge):
+    """Pygments bridge with a persistent cache of highlighted code blocks.
+
+    Entries are keyed by the source, lexer, options, style, and the Pygments
+    and Sphinx versions, and stored one file per entry so that parallel
+    writers can share the cache.
+    Blocks that warn when highlighted are not cached, so the warning is
+    repeated on every build.
+    Hits and misses are counted in shared memory, so that they include
+    blocks highlighted by parallel write workers.
+    Hits touch their entry, so that entries not used since the bridge was
+    created can be found by modification time and pruned.
+    """
+
+    def __init__(self, dest: str = "html", stylename: str = "sphinx", *, cache_dir: Path) -> None:
+        super().__init__(dest, stylename)
+        self.cache_dir = Path(cache_dir)
+        self._counts = multiprocessing.Array("Q", 2)  # hits, misses
+        # Taken from the file system rather than the clock, as file times
+        # may lag behind the clock
+        marker = self.cache_dir / "started"
+        _write_atomic(marker, "")
+        self._started = marker.stat().st_mtime_ns
+
+    @property
+    def hits(self) -> int:
+        return self._counts[0]
+
+    @property
+    def misses(self) -> int:
+        return self._counts[1]
+
+    def _count(self, index: int) -> None:
+        with self._counts.get_lock():
+            self._counts[index] += 1
+
+    def log_hit_rate(self) -> None:
+        """Report how many code blocks were read from the cache."""
+        total = self.hits + self.misses
+        if total:
+            logger.verbose(
+                "highlight cache: %d of %d code blocks cached (%.0f%%)", self.hits, total, 100 * self.hits / total
+            )
+
+    def prune_unused(self) -> None:
+        """Remove entries that have not been used since the bridge was created."""
+        removed = 0
+        for path in self.cache_dir.glob("??/*"):
+            try:
+                if path.stat().st_mtime_ns < self._started:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        for shard in self.cache_dir.glob("??/"):
+            try:
+                shard.rmdir()
+            except OSError:
+                pass  # not empty
+        if removed:
+            logger.verbose("highlight cache: removed %d unused code blocks", removed)
+
+    def highlight_block(
+        self,
+        source: str,
+        lang: str,
+        opts: dict[str, Any] | None = None,
+        force: bool = False,
+        location: Any = None,
+        **kwargs: Any,
+    ) -> str:
+        if not isinstance(source, str):
+            source = source.decode()
+        key = json.dumps(
+            [
+                pygments.__version__,
+                sphinx.__version__,
+                self.dest,
+                self.formatter_args["style"].__name__,
+                lang,
+                opts,
+                force,
+                kwargs,
+                source,
+            ],
+            sort_keys=True,
+            default=repr,
+        )
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        path = self.cache_dir / digest[:2] / digest[2:]
+        try:
+            highlighted = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        else:
+            self._count(0)
+            return highlighted
+
+        self._count(1)
+        recorder = _WarningRecorder()
+        highlighting.logger.logger.addFilter(recorder)
+        try:
+            highlighted = super().highlight_block(source, lang, opts, force, location, **kwargs)
+        finally:
+            highlighting.logger.logger.removeFilter(recorder)
+        if not recorder.warned:
+            _write_atomic(path, highlighted)
+        return highlighted
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    # Write to a temporary file first, as other processes may read the entry
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    os.replace(temp_path, path)
@@ -1,10 +1,43 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING
+
 from docutils import nodes
 from docutils.frontend import OptionParser
 from sphinx.builders.html import StandaloneHTMLBuilder
+from sphinx.environment import CONFIG_OK
 from sphinx.writers.html import HTMLWriter
 
 from sphinx.builders.dirhtml import DirectoryHTMLBuilder
 
+from pep_sphinx_extensions.artifacts import write_if_changed
+from pep_sphinx_extensions.pep_processor.html.pep_assets import write_theme_assets
+from pep_sphinx_extensions.pep_processor.html.pep_highlighter import CachedPygmentsBridge
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Start time of the last successful build, in the doctree directory
+WRITE_STAMP_NAME = "pep-write-stamp.json"
+
+
+class OutputPath(type(Path())):
+    """An output file path, only written to if the contents change.
+
+    This keeps the modification times of unchanged pages,
+    so that deployments only include pages that changed.
+    As Sphinx compares these times with those of the sources to find
+    outdated pages, ``FileBuilder.get_outdated_docs`` also takes the time
+    of the last successful build into account.
+    """
+
+    def write_text(self, data: str, encoding: str | None = None, errors: str | None = None, newline=None) -> int:
+        write_if_changed(self, data.encode(encoding or "utf-8", errors or "strict"))
+        return len(data)
+
 
 class FileBuilder(StandaloneHTMLBuilder):
     copysource = False  # Prevent unneeded source copying - we link direct to GitHub
@@ -15,13 +48,75 @@ class FileBuilder(StandaloneHTMLBuilder):
     relations = {}
     _script_files = _css_files = []
     globalcontext = {"script_files": [], "css_files": []}
+    _translator = None
+    writes_all_pages = False
+
+    def init(self) -> None:
+        super().init()
+        # In microseconds, as with Sphinx's modification times
+        self.build_started = time.time_ns() // 1000
 
-    def prepare_writing(self, _doc_names: set[str]) -> None:
+    def get_outdated_docs(self) -> Iterator[str]:
+        """Find outdated pages, as Sphinx does, but skip those written since their sources changed.
+
+        Unchanged pages keep an older modification time than their sources
+        or templates, so Sphinx would find them outdated on every build.
+        """
+        written = load_write_stamp(Path(self.doctreedir), self.tags)
+        # A changed configuration may change every page, as in Sphinx
+        if self.env.config_status != CONFIG_OK:
+            written = None
+        template_mtime = int(self.templates.newest_template_mtime() * 10**6) if self.templates else 0
+        for docname in super().get_outdated_docs():
+            if written is None or not self._written_since(docname, written, template_mtime):
+                yield docname
+
+    def _written_since(self, docname: str, written: int, template_mtime: int) -> bool:
+        if docname not in self.env.all_docs:
+            return False
+        try:
+            Path(self.get_output_path(docname)).stat()
+            # Rounded up to microseconds, as by Sphinx
+            source_mtime = -(Path(self.env.doc2path(docname)).stat().st_mtime_ns // -1000)
+        except OSError:
+            return False  # missing output, or source removed
+        return max(source_mtime, template_mtime) <= written
+
+    def record_write_stamp(self) -> None:
+        """Record that every page is up to date as of the start of this build."""
+        save_write_stamp(Path(self.doctreedir), self.build_started, self.tags)
+
+    def init_highlighter(self) -> None:
+        super().init_highlighter()
+        cache_dir = self.config.pep_highlight_cache_dir or Path(self.doctreedir, "highlight")
+        highlighter = CachedPygmentsBridge("html", cache_dir=cache_dir)
+        highlighter.formatter_args = self.highlighter.formatter_args  # keep the theme's style
+        self.highlighter = highlighter
+
+    def prepare_writing(self, doc_names: set[str]) -> None:
+        # Only a build that writes every page uses every highlight cache entry
+        self.writes_all_pages = doc_names >= self.env.found_docs
         self.docwriter = HTMLWriter(self)
         _opt_parser = OptionParser([self.docwriter], defaults=self.env.settings, read_config_files=True)
         self.docsettings = _opt_parser.get_default_values()
         self._orig_css_files = self._orig_js_files = []
 
+        # bundled theme assets with content-hashed names, referenced by page.html
+        generated = {"pygments.css": self.highlighter.get_stylesheet()}
+        if self.dark_highlighter is not None:
+            generated["pygments_dark.css"] = self.dark_highlighter.get_stylesheet()
+        static_dir = Path(self.theme.get_theme_dirs()[0], "static")
+        assets = write_theme_assets(static_dir, self.outdir, generated)
+        self.globalcontext = FileBuilder.globalcontext | {"assets": assets}
+
+    def get_output_path(self, page_name: str, /) -> Path:
+        return OutputPath(super().get_output_path(page_name))
+
+    def create_translator(self, *args) -> nodes.NodeVisitor:
+        # Keep the translator of the current document, to reuse its contents
+        self._translator = super().create_translator(*args)
+        return self._translator
+
     def get_doc_context(self, docname: str, body: str, _metatags: str) -> dict:
         """Collect items for the template context of a page."""
         try:
@@ -29,7 +124,11 @@ class FileBuilder(StandaloneHTMLBuilder):
         except KeyError:
             title = ""
 
-        # local table of contents
+        # local table of contents, as already rendered in the body of most PEPs
+        toc = getattr(self._translator, "contents_toc", None)
+        if toc is not None:
+            return {"title": title, "toc": toc, "body": body}
+
         toc_tree = self.env.tocs[docname].deepcopy()
         if len(toc_tree) and len(toc_tree[0]) > 1:
             toc_tree = toc_tree[0][1]  # don't include document title
@@ -48,4 +147,22 @@ class DirectoryBuilder(FileBuilder):
     # sync all overwritten things from DirectoryHTMLBuilder
     name = DirectoryHTMLBuilder.name
     get_target_uri = DirectoryHTMLBuilder.get_target_uri
-    get_output_path = DirectoryHTMLBuilder.get_output_path
+
+    def get_output_path(self, page_name: str, /) -> Path:
+        return OutputPath(DirectoryHTMLBuilder.get_output_path(self, page_name))
+
+
+def load_write_stamp(doctree_dir: Path, tags) -> int | None:
+    """Return the start time of the last successful build, if built with the same tags."""
+    try:
+        stamp = json.loads(Path(doctree_dir, WRITE_STAMP_NAME).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    if stamp.get("tags") != sorted(tags):
+        return None
+    return stamp.get("started")
+
+
+def save_write_stamp(doctree_dir: Path, started: int, tags) -> None:
+    data = json.dumps({"started": started, "tags": sorted(tags)})
+    write_if_changed(Path(doctree_dir, WRITE_STAMP_NAME), data.encode("utf-8"))
@@ -15,16 +15,24 @@ class PEPTranslator(html5.HTML5Translator):
     def __init__(self, document: nodes.document, builder: html.StandaloneHTMLBuilder):
         super().__init__(document, builder)
         self.compact_simple: bool = False
+        # HTML of the in-body table of contents, reused for the sidebar
+        self.contents_toc: str | None = None
+        self._contents_start: int = 0
+        self._first_visible_children: dict[nodes.Element, nodes.Node | None] = {}
 
-    @staticmethod
-    def should_be_compact_paragraph(node: nodes.paragraph) -> bool:
+    def should_be_compact_paragraph(self, node: nodes.paragraph) -> bool:
         """Check if paragraph should be compact.
 
         Omitting <p/> tags around paragraph nodes gives visually compact lists.
 
         """
+        parent = node.parent
         # Never compact paragraphs that are children of document or compound.
-        if isinstance(node.parent, (nodes.document, nodes.compound)):
+        if isinstance(parent, (nodes.document, nodes.compound)):
+            return False
+
+        # Only first paragraph can be compact (ignoring initial label & invisible nodes)
+        if self._first_visible_child(parent) is not node:
             return False
 
         # Check for custom attributes in paragraph.
@@ -36,15 +44,28 @@ class PEPTranslator(html5.HTML5Translator):
             if any((key != "classes", not set(value) <= {"first", "last"})):
                 return False
 
-        # Only first paragraph can be compact (ignoring initial label & invisible nodes)
-        first = isinstance(node.parent[0], nodes.label)
-        visible_siblings = [child for child in node.parent.children[first:] if not isinstance(child, nodes.Invisible)]
-        if visible_siblings[0] is not node:
-            return False
-
         # otherwise, the paragraph should be compact
         return True
 
+    def _first_visible_child(self, parent: nodes.Element) -> nodes.Node | None:
+        """Return the first visible child of parent, ignoring an initial label.
+
+        Cached per parent, so that checking every paragraph is linear in the
+        number of siblings rather than quadratic.
+
+        """
+        try:
+            return self._first_visible_children[parent]
+        except KeyError:
+            pass
+        first = isinstance(parent[0], nodes.label)
+        visible = next(
+            (child for child in parent.children[first:] if not isinstance(child, nodes.Invisible)),
+            None,
+        )
+        self._first_visible_children[parent] = visible
+        return visible
+
     def visit_paragraph(self, node: nodes.paragraph) -> None:
         """Remove <p> tags if possible."""
         if self.should_be_compact_paragraph(node):
@@ -93,13 +114,46 @@ class PEPTranslator(html5.HTML5Translator):
         if isinstance(node.parent, nodes.section) and "contents" in node.parent["names"]:
             self.body.append("<details><summary>Table of Contents</summary>")
             self.context.append("</details>")
-        super().visit_bullet_list(node)
+            super().visit_bullet_list(node)
+            self._contents_start = len(self.body)
+        else:
+            super().visit_bullet_list(node)
 
     def depart_bullet_list(self, node):
         super().depart_bullet_list(node)
         if isinstance(node.parent, nodes.section) and "contents" in node.parent["names"]:
+            # The sidebar list is not compact, so omit the opening tag's class
+            self.contents_toc = "<ul>\n" + "".join(self.body[self._contents_start:])
             self.body.append(self.context.pop())
 
+    def visit_table(self, node):
+        # Wrap tables in the PEP body, to allow for responsive scrolling
+        if _in_pep_content(node):
+            self.body.append('<div class="table-wrapper">\n')
+            self.context.append("</div>\n")
+        else:
+            self.context.append("")
+        super().visit_table(node)
+
+    def depart_table(self, node):
+        super().depart_table(node)
+        self.body.append(self.context.pop())
+
+    def visit_desc(self, node):
+        # Object descriptions are listed in the sidebar TOC, but not in the contents
+        self.contents_toc = None
+        super().visit_desc(node)
+
     def unknown_visit(self, node: nodes.Node) -> None:
         """No processing for unknown node types."""
         pass
+
+
+def _in_pep_content(node: nodes.Node) -> bool:
+    """Check if node is within the section holding the PEP body."""
+    parent = node.parent
+    while parent is not None:
+        if isinstance(parent, nodes.section) and "pep-content" in parent["ids"]:
+            return True
+        parent = parent.parent
+    return False
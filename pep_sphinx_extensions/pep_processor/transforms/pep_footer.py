@@ -1,3 +1,4 @@
+import heapq
 import time
 from pathlib import Path
 import subprocess
@@ -55,6 +56,16 @@ def get_page_footer_context(pep_stem: str) -> dict[str, str]:
     return context
 
 
+def get_recently_modified(count: int) -> list[tuple[str, str]]:
+    """The most recently modified PEPs, newest first, as (stem, time) pairs.
+
+    Times are in the same format as ``last_modified`` in the page footer.
+    """
+    modified = ((stem, iso_time) for stem, iso_time in _LAST_MODIFIED_TIMES.items() if iso_time)
+    # ties are broken by the PEP file name, for reproducible output
+    return heapq.nlargest(count, modified, key=lambda item: (item[1], item[0]))
+
+
 def _get_last_modified_timestamps():
     # get timestamps and changed files from all commits (without paging results)
     args = ("git", "--no-pager", "log", "--format=#%at", "--name-only")
@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 import re
 
@@ -122,13 +123,9 @@ class PEPHeaders(transforms.Transform):
                     # If the Resolution header is already a link, don't prettify it
                     if name == "resolution" and node["refuri"] != node[0]:
                         continue
-                    # Have known mailto links link to their main list pages
-                    if node["refuri"].lower().startswith("mailto:"):
-                        node["refuri"] = _generate_list_url(node["refuri"])
-                    parts = node["refuri"].lower().split("/")
-                    if len(parts) <= 2 or parts[2] not in LINK_PRETTIFIERS:
+                    node["refuri"], pretty_title = _classify_link(str(node["refuri"]))
+                    if pretty_title is None:
                         continue
-                    pretty_title = _make_link_pretty(str(node["refuri"]))
                     if name == "post-history":
                         node["reftitle"] = pretty_title
                     else:
@@ -273,6 +270,25 @@ LINK_PRETTIFIERS = {
 }
 
 
+# Host of absolute and scheme-relative URLs, for selecting a prettifier
+URL_HOST = re.compile(r"[^/]*//([^/]*)")
+
+
+@functools.lru_cache(maxsize=2048)
+def _classify_link(refuri: str) -> tuple[str, str | None]:
+    """Return the link target and its pretty title, if it has one.
+
+    The same list and Discourse links recur across the corpus, so results are memoised.
+    """
+    # Have known mailto links link to their main list pages
+    if refuri.lower().startswith("mailto:"):
+        refuri = _generate_list_url(refuri)
+    host = URL_HOST.match(refuri)
+    if host is None or host[1].lower() not in LINK_PRETTIFIERS:
+        return refuri, None
+    return refuri, _make_link_pretty(refuri)
+
+
 def _process_pretty_url(url: str) -> tuple[str, str]:
     parts = url.lower().strip().strip("/").split("/")
     try:
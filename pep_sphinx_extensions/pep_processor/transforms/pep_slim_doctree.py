@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from docutils import nodes
+from docutils import transforms
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PEPSlimDoctree(transforms.Transform):
+    """Strip payload the HTML writer never reads from the doctree.
+
+    Opt-in with the ``pep_slim_doctrees`` configuration value.
+
+     - Remove ``rawsource`` from all elements except fixed-text elements
+       (literal blocks, doctest blocks, raw, and maths blocks), whose
+       ``rawsource`` is compared with their text to decide whether to
+       highlight. Inline maths is not a fixed-text element, and is
+       stripped, as it is rendered from its text.
+
+    ``source`` and ``line`` are kept for warnings in the write phase,
+    as are the headers stored on the document by ``PEPHeaders``.
+    """
+
+    # Run after all content transforms, but before Sphinx's DoctreeReadEvent (880),
+    # so that titles and tables of contents in the environment are slimmed too
+    default_priority = 870
+
+    def apply(self) -> None:
+        env = self.document.settings.env
+        if not env.config.pep_slim_doctrees:
+            return
+        slim_doctree(self.document)
+
+
+def slim_doctree(document: nodes.document) -> None:
+    for node in document.findall(nodes.Element):
+        if not isinstance(node, nodes.FixedTextElement):
+            node.rawsource = ""
+
+
+def log_doctree_size(doctree_dir: Path) -> None:
+    """Report the size of the doctrees and the pickled environment.
+
+    Other build caches kept in the doctree directory are not counted.
+    """
+    doctree_dir = Path(doctree_dir)
+    paths = [*doctree_dir.rglob("*.doctree"), doctree_dir / "environment.pickle"]
+    total = count = 0
+    for path in paths:
+        if path.is_file():
+            total += path.stat().st_size
+            count += 1
+    logger.info("doctrees and environment: %d files, %.1f MiB", count, total / 2**20)
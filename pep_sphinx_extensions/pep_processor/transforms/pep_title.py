@@ -1,11 +1,23 @@
+from __future__ import annotations
+
+import functools
 from pathlib import Path
+import re
+from typing import TYPE_CHECKING
 
 from docutils import nodes
 from docutils import transforms
 from docutils import utils
+from docutils.parsers.rst import languages
 from docutils.parsers.rst import roles
 from docutils.parsers.rst import states
 
+if TYPE_CHECKING:
+    from optparse import Values
+
+# Characters that may start inline markup, and standalone hyperlinks
+INLINE_MARKUP_CANDIDATES = re.compile(r"[*`_|\\@]|://|mailto:")
+
 
 class PEPTitle(transforms.Transform):
     """Add PEP title and organise document hierarchy."""
@@ -59,8 +71,29 @@ class PEPTitle(transforms.Transform):
 
 def _line_to_nodes(text: str) -> list[nodes.Node]:
     """Parse RST string to nodes."""
-    document = utils.new_document("<inline-rst>")
-    document.settings.pep_references = document.settings.rfc_references = False  # patch settings
-    states.RSTStateMachine(state_classes=states.state_classes, initial_state="Body").run([text], document)  # do parsing
-    roles._roles.pop("", None)  # restore the "default" default role after parsing a document
-    return document[0].children
+    text = text.rstrip()
+    if INLINE_MARKUP_CANDIDATES.search(text) is None:
+        return [nodes.Text(text)]  # plain text, the common case
+
+    settings, inliner = _inline_parser()
+    # A new document per title, so that ids and names do not leak between PEPs
+    document = utils.new_document("<inline-rst>", settings)
+    memo = states.Struct(
+        document=document,
+        reporter=document.reporter,
+        language=languages.get_language(settings.language_code, document.reporter),
+        inliner=inliner,
+    )
+    text_nodes, _messages = inliner.parse(text, 1, memo, nodes.paragraph())
+    roles._roles.pop("", None)  # restore the "default" default role after parsing
+    return text_nodes
+
+
+@functools.cache
+def _inline_parser() -> tuple[Values, states.Inliner]:
+    """Set up the settings and inline parser once, rather than a state machine per title."""
+    settings = utils.new_document("<inline-rst>").settings
+    settings.pep_references = settings.rfc_references = False  # patch settings
+    inliner = states.Inliner()
+    inliner.init_customizations(settings)
+    return settings, inliner
@@ -0,0 +1,67 @@
+"""Index of PEP authors, built once per corpus."""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import unicodedata
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pep_sphinx_extensions.pep_zero_generator.parser import PEP
+
+
+@dataclasses.dataclass
+class AuthorEntry:
+    """Represent an author across all of their PEPs."""
+    name: str  # The author's full name.
+    sort_key: str  # Key for ordering the Authors/Owners table.
+    emails: list[str] = dataclasses.field(default_factory=list)  # In order of first use.
+    peps: list[int] = dataclasses.field(default_factory=list)  # PEP numbers, ascending.
+
+
+def build_author_index(peps: Iterable[PEP]) -> dict[str, AuthorEntry]:
+    """Map each author's name to their entry, in display order.
+
+    The sort key is computed once per author, rather than once per sort.
+    """
+    index: dict[str, AuthorEntry] = {}
+    for pep in peps:
+        for author in pep.authors:
+            entry = index.get(author.full_name)
+            if entry is None:
+                entry = AuthorEntry(author.full_name, author_sort_key(author.full_name))
+                index[author.full_name] = entry
+
+            # Since peps is sorted by PEP number, these are deterministic
+            if author.email and author.email not in entry.emails:
+                entry.emails.append(author.email)
+            if not entry.peps or entry.peps[-1] != pep.number:
+                entry.peps.append(pep.number)
+
+    return dict(sorted(index.items(), key=lambda item: item[1].sort_key))
+
+
+def create_authors_json(author_index: dict[str, AuthorEntry]) -> str:
+    return json.dumps(
+        {name: {"emails": entry.emails, "peps": entry.peps} for name, entry in author_index.items()},
+        indent=1,
+        ensure_ascii=False,
+    )
+
+
+def author_sort_key(author_name: str) -> str:
+    """Skip lower-cased words in surname when sorting."""
+    surname, *_ = author_name.split(",")
+    surname_parts = surname.split()
+    for i, part in enumerate(surname_parts):
+        if part[0].isupper():
+            base = " ".join(surname_parts[i:]).lower()
+            break
+    else:
+        # If no capitals, use the whole string
+        base = surname.lower()
+    # Normalisation is a no-op for ASCII names, the common case
+    return base if base.isascii() else unicodedata.normalize("NFKD", base)
@@ -0,0 +1,136 @@
+"""Export PEP metadata to an SQLite database."""
+
+from __future__ import annotations
+
+import datetime as dt
+import re
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pep_sphinx_extensions.pep_zero_generator.parser import PEP
+
+SCHEMA = """\
+CREATE TABLE peps (
+    number INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    status TEXT NOT NULL,
+    type TEXT NOT NULL,
+    created TEXT NOT NULL,  -- YYYY-MM-DD
+    discussions_to TEXT,
+    post_history TEXT,
+    resolution TEXT,
+    url TEXT NOT NULL
+);
+CREATE TABLE authors (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE pep_authors (
+    pep INTEGER NOT NULL REFERENCES peps (number),
+    author INTEGER NOT NULL REFERENCES authors (id),
+    position INTEGER NOT NULL,  -- order of the author in the Author header
+    email TEXT,
+    PRIMARY KEY (pep, author)
+);
+CREATE TABLE topics (
+    pep INTEGER NOT NULL REFERENCES peps (number),
+    topic TEXT NOT NULL,
+    PRIMARY KEY (pep, topic)
+);
+CREATE TABLE versions (
+    pep INTEGER NOT NULL REFERENCES peps (number),
+    version TEXT NOT NULL,  -- one row per version in the Python-Version header
+    PRIMARY KEY (pep, version)
+);
+CREATE TABLE cross_references (
+    pep INTEGER NOT NULL REFERENCES peps (number),
+    relation TEXT NOT NULL,  -- 'requires', 'replaces' or 'superseded_by'
+    target INTEGER NOT NULL,
+    PRIMARY KEY (pep, relation, target)
+);
+
+CREATE INDEX peps_status_type ON peps (status, type);
+CREATE INDEX peps_type ON peps (type);
+CREATE INDEX peps_created ON peps (created);
+CREATE INDEX pep_authors_author ON pep_authors (author);
+CREATE INDEX topics_topic ON topics (topic);
+CREATE INDEX versions_version ON versions (version);
+CREATE INDEX cross_references_target ON cross_references (target, relation);
+"""
+
+
+def create_pep_database(peps: list[PEP]) -> bytes:
+    """Return an SQLite database of PEP metadata, serialised to bytes."""
+    connection = sqlite3.connect(":memory:")
+    try:
+        connection.executescript(SCHEMA)
+        with connection:
+            _insert_peps(connection, peps)
+        # Collect statistics for the query planner
+        connection.execute("ANALYZE")
+        return connection.serialize()
+    finally:
+        connection.close()
+
+
+def _insert_peps(connection: sqlite3.Connection, peps: list[PEP]) -> None:
+    author_ids: dict[str, int] = {}
+    for pep in peps:
+        connection.execute(
+            "INSERT INTO peps VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                pep.number,
+                pep.title,
+                pep.status,
+                pep.pep_type,
+                _iso_date(pep.created),
+                pep.discussions_to,
+                pep.post_history,
+                pep.resolution,
+                f"https://peps.python.org/pep-{pep.number:0>4}/",
+            ),
+        )
+
+        for position, author in enumerate(pep.authors):
+            if author.full_name not in author_ids:
+                author_ids[author.full_name] = len(author_ids) + 1
+                connection.execute(
+                    "INSERT INTO authors VALUES (?, ?)",
+                    (author_ids[author.full_name], author.full_name),
+                )
+            connection.execute(
+                "INSERT OR IGNORE INTO pep_authors VALUES (?, ?, ?, ?)",
+                (pep.number, author_ids[author.full_name], position, author.email or None),
+            )
+
+        connection.executemany(
+            "INSERT INTO topics VALUES (?, ?)",
+            [(pep.number, topic) for topic in sorted(pep.topic)],
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO versions VALUES (?, ?)",
+            [(pep.number, version) for version in _split_list(pep.python_version)],
+        )
+        for relation, value in (
+            ("requires", pep.requires),
+            ("replaces", pep.replaces),
+            ("superseded_by", pep.superseded_by),
+        ):
+            connection.executemany(
+                "INSERT OR IGNORE INTO cross_references VALUES (?, ?, ?)",
+                [(pep.number, relation, int(target)) for target in _split_list(value)],
+            )
+
+
+def _split_list(value: str | None) -> list[str]:
+    if not value:
+        return []
+    return [item for item in re.split(r"[,\s]+", value) if item]
+
+
+def _iso_date(date: str) -> str:
+    try:
+        return dt.datetime.strptime(date, "%d-%b-%Y").date().isoformat()
+    except ValueError:
+        return date
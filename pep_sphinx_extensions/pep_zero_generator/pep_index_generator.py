@@ -17,16 +17,25 @@ to allow it to be processed as normal.
 """
 from __future__ import annotations
 
+import hashlib
 import json
-import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from pep_sphinx_extensions.artifacts import manifest_snapshot
+from pep_sphinx_extensions.artifacts import recorded_since
+from pep_sphinx_extensions.artifacts import replace_artifact
+from pep_sphinx_extensions.artifacts import write_artifact
+from pep_sphinx_extensions.pep_zero_generator import authors
+from pep_sphinx_extensions.pep_zero_generator import database
 from pep_sphinx_extensions.pep_zero_generator import parser
 from pep_sphinx_extensions.pep_zero_generator import subindices
 from pep_sphinx_extensions.pep_zero_generator import writer
 from pep_sphinx_extensions.pep_zero_generator.constants import SUBINDICES_BY_TOPIC
-from release_management.serialize import create_release_cycle, create_release_schedule_calendar, create_release_json
+from release_management import RELEASE_DIR
+from release_management import serialize
+from release_management import source_date
+from release_management.serialize import create_release_cycle, create_release_json, write_release_calendars
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
@@ -53,11 +62,63 @@ def create_pep_json(peps: list[parser.PEP]) -> str:
     return json.dumps({pep.number: pep.full_details for pep in peps}, indent=1)
 
 
+# Number of change sets kept in the rolling window of ``peps-changes.json``
+CHANGES_WINDOW = 100
+
+# The pep_sphinx_extensions package, whose source is part of the fingerprint
+EXTENSION_DIR = Path(__file__).resolve().parent.parent
+
+
 def write_peps_json(peps: list[parser.PEP], path: Path) -> None:
     # Create peps.json
     json_peps = create_pep_json(peps)
-    os.makedirs(os.path.join(path, "api"), exist_ok=True)
-    Path(path, "api", "peps.json").write_text(json_peps, encoding="utf-8")
+
+    # Keep the previous build's copy to work out what changed
+    try:
+        previous = json.loads(Path(path, "api", "peps.json").read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        previous = None
+
+    write_artifact(path, "api/peps.json", json_peps)
+    write_peps_changes(previous, json.loads(json_peps), path)
+
+
+def diff_peps_json(old: dict[str, dict], new: dict[str, dict]) -> dict[str, list | dict]:
+    """Return the PEPs added, removed, and changed between two ``peps.json`` maps.
+
+    Changed PEPs are mapped to the fields that differ, with their old and new values.
+    """
+    changed = {}
+    for number in sorted(old.keys() & new.keys(), key=int):
+        old_details, new_details = old[number], new[number]
+        fields = {
+            field: {"old": old_details.get(field), "new": new_details.get(field)}
+            for field in sorted(old_details.keys() | new_details.keys())
+            if old_details.get(field) != new_details.get(field)
+        }
+        if fields:
+            changed[number] = fields
+
+    return {
+        "added": sorted(map(int, new.keys() - old.keys())),
+        "removed": sorted(map(int, old.keys() - new.keys())),
+        "changed": changed,
+    }
+
+
+def write_peps_changes(previous: dict[str, dict] | None, current: dict[str, dict], path: Path) -> None:
+    """Record changes since the previous build in a rolling window of change sets."""
+    try:
+        changes = json.loads(Path(path, "api", "peps-changes.json").read_text(encoding="utf-8"))["changes"]
+    except (FileNotFoundError, ValueError, KeyError):
+        changes = []
+
+    diff = diff_peps_json(previous, current) if previous is not None else None
+    if diff is not None and any(diff.values()):
+        date = source_date().isoformat(timespec="seconds")
+        changes = [{"date": date, **diff}, *changes][:CHANGES_WINDOW]
+
+    write_artifact(path, "api/peps-changes.json", json.dumps({"changes": changes}, indent=1))
 
 
 def build_release_peps(peps: list[parser.PEP]) -> dict[str, int]:
@@ -76,10 +137,67 @@ def build_release_peps(peps: list[parser.PEP]) -> dict[str, int]:
     return release_peps
 
 
+def header_fingerprint(path: Path, builder: str) -> str:
+    """Hash everything PEP 0 generation depends on.
+
+    This is the header block of each PEP, the release data, and the source
+    of the extension and release management packages, but not the PEP bodies.
+    """
+    digest = hashlib.sha256(builder.encode())
+    for file_path in sorted(path.glob("pep-????.rst")):
+        if file_path.match("pep-0000*"):
+            continue  # Skip pre-existing PEP 0 files
+        # The header block ends at the first empty line, as in ``email.parser``
+        # (used by ``parser.PEP``), whatever the line endings
+        text = file_path.read_bytes().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        header, _, _body = text.partition(b"\n\n")
+        digest.update(file_path.name.encode() + b"\0" + header + b"\0")
+
+    digest.update((RELEASE_DIR / "python-releases.toml").read_bytes())
+    # The release calendar omits releases older than seven years
+    digest.update(serialize.SEVEN_YEARS_AGO.isoformat().encode())
+    # PEP 0 and the API files also depend on modules outside this package,
+    # such as pep_headers, artifacts, and release_management
+    for package_dir in EXTENSION_DIR, RELEASE_DIR:
+        for source_path in sorted(package_dir.rglob("*.py")):
+            if "tests" not in source_path.relative_to(package_dir).parts:
+                digest.update(source_path.relative_to(package_dir).as_posix().encode() + b"\0")
+                digest.update(source_path.read_bytes())
+    return digest.hexdigest()
+
+
+def _generated_docnames() -> list[str]:
+    return ["numerical", "pep-0000", "topic/index", *(f"topic/{subindex}" for subindex in SUBINDICES_BY_TOPIC)]
+
+
+def is_up_to_date(env: BuildEnvironment, srcdir: Path, outdir: Path, fingerprint: str) -> bool:
+    """Whether the previous build's PEP 0 sources and artifacts can be reused.
+
+    The fingerprint must match, and every generated source and every artifact
+    written by the previous generation must still exist.
+    """
+    if getattr(env, "pep_zero_fingerprint", None) != fingerprint:
+        return False
+    written = getattr(env, "pep_zero_artifacts", None)
+    if not written:
+        return False  # environment from before the artifacts were recorded
+    return all(Path(srcdir, f"{docname}.rst").is_file() for docname in _generated_docnames()) and all(
+        Path(outdir, name).is_file() for name in written
+    )
+
+
 def create_pep_zero(app: Sphinx, env: BuildEnvironment, docnames: list[str]) -> None:
+    # Skip generation entirely if no PEP header changed since the last build
+    fingerprint = header_fingerprint(Path(app.srcdir), env.settings["builder"])
+    if is_up_to_date(env, Path(app.srcdir), Path(app.outdir), fingerprint):
+        env.found_docs.update(_generated_docnames())
+        return
+
+    snapshot = manifest_snapshot()
     peps = _parse_peps(Path(app.srcdir))
 
     release_peps = build_release_peps(peps)
+    author_index = authors.build_author_index(peps)
 
     numerical_index_text = writer.PEPZeroWriter(
         release_peps
@@ -87,7 +205,7 @@ def create_pep_zero(app: Sphinx, env: BuildEnvironment, docnames: list[str]) ->
     subindices.update_sphinx("numerical", numerical_index_text, docnames, env)
 
     pep0_text = writer.PEPZeroWriter(
-        release_peps
+        release_peps, author_index
     ).write_pep0(peps, builder=env.settings["builder"])
     pep0_path = subindices.update_sphinx("pep-0000", pep0_text, docnames, env)
     peps.append(parser.PEP(pep0_path))
@@ -101,12 +219,15 @@ def create_pep_zero(app: Sphinx, env: BuildEnvironment, docnames: list[str]) ->
     )
 
     write_peps_json(peps, Path(app.outdir))
-
-    release_cycle = create_release_cycle()
-    app.outdir.joinpath('api/release-cycle.json').write_text(release_cycle, encoding="utf-8")
-
-    release_json = create_release_json()
-    app.outdir.joinpath('api/python-releases.json').write_text(release_json, encoding="utf-8")
-
-    release_ical = create_release_schedule_calendar()
-    app.outdir.joinpath('release-schedule.ics').write_text(release_ical, encoding="utf-8")
+    write_artifact(app.outdir, "api/peps.sqlite", database.create_pep_database(peps))
+    write_artifact(app.outdir, "api/authors.json", authors.create_authors_json(author_index))
+
+    write_artifact(app.outdir, "api/release-cycle.json", create_release_cycle())
+    write_artifact(app.outdir, "api/python-releases.json", create_release_json())
+    for calendar_path in write_release_calendars(Path(app.outdir)):
+        # Compress and record the calendar, which is already in place
+        replace_artifact(app.outdir, calendar_path.name, calendar_path)
+
+    # Stored in the pickled environment for the next build
+    env.pep_zero_fingerprint = fingerprint
+    env.pep_zero_artifacts = recorded_since(snapshot)
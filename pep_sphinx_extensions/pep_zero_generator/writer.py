@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-import unicodedata
 
 from pep_sphinx_extensions.pep_processor.transforms.pep_headers import ABBREVIATED_STATUSES
 from pep_sphinx_extensions.pep_processor.transforms.pep_headers import ABBREVIATED_TYPES
+from pep_sphinx_extensions.pep_zero_generator.authors import build_author_index
 from pep_sphinx_extensions.pep_zero_generator.constants import DEAD_STATUSES
 from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_ACCEPTED
 from pep_sphinx_extensions.pep_zero_generator.constants import STATUS_ACTIVE
@@ -24,6 +24,7 @@ from pep_sphinx_extensions.pep_zero_generator.constants import TYPE_VALUES
 from pep_sphinx_extensions.pep_zero_generator.errors import PEPError
 
 if TYPE_CHECKING:
+    from pep_sphinx_extensions.pep_zero_generator.authors import AuthorEntry
     from pep_sphinx_extensions.pep_zero_generator.parser import PEP
 
 HEADER = """\
@@ -59,9 +60,15 @@ class PEPZeroWriter:
         801: "Warsaw",
     }
 
-    def __init__(self, release_peps: dict[str, int] | None = None):
+    def __init__(
+        self,
+        release_peps: dict[str, int] | None = None,
+        author_index: dict[str, AuthorEntry] | None = None,
+    ):
         self.output: list[str] = []
         self.release_peps = release_peps or {}
+        # Built from the PEPs passed to write_pep0 if not given
+        self.author_index = author_index
 
     def emit_text(self, content: str) -> None:
         # Appends content argument to the output list
@@ -276,16 +283,18 @@ class PEPZeroWriter:
 
         if is_pep0:
             # PEP owners
-            authors_dict = _verify_email_addresses(peps)
-            max_name_len = max(len(author_name) for author_name in authors_dict)
+            author_index = self.author_index
+            if author_index is None:
+                author_index = build_author_index(peps)
+            max_name_len = max(len(author_name) for author_name in author_index)
             self.emit_title("Authors/Owners")
             self.emit_author_table_separator(max_name_len)
             self.emit_text(f"{'Name':{max_name_len}}  Email Address")
             self.emit_author_table_separator(max_name_len)
-            for author_name in _sort_authors(authors_dict):
-                # Use the email from authors_dict instead of the one from "author" as
-                # the author instance may have an empty email.
-                self.emit_text(f"{author_name:{max_name_len}}  {authors_dict[author_name]}")
+            # The index is already in display order. Combine multiple email
+            # addresses with commas, as an author may omit their email in some PEPs.
+            for author_name, entry in author_index.items():
+                self.emit_text(f"{author_name:{max_name_len}}  {', '.join(entry.emails)}")
             self.emit_author_table_separator(max_name_len)
             self.emit_newline()
             self.emit_newline()
@@ -340,40 +349,3 @@ def _classify_peps(peps: list[PEP]) -> tuple[list[PEP], ...]:
             raise PEPError(f"Unsorted ({pep.pep_type}/{pep.status})", pep.filename, pep.number)
     return meta, info, provisional, accepted, open_, finished, historical, deferred, dead
 
-
-def _verify_email_addresses(peps: list[PEP]) -> dict[str, str]:
-    authors_dict: dict[str, list[str]] = {}
-    for pep in peps:
-        for author in pep.authors:
-            # If this is the first time we have come across an author, add them.
-            if author.full_name not in authors_dict:
-                authors_dict[author.full_name] = []
-
-            # If the new email is an empty string, move on.
-            if not author.email:
-                continue
-            # If the email has not been seen, add it to the list.
-            emails = authors_dict[author.full_name]
-            if author.email not in emails:
-                emails.append(author.email)
-
-    # Combine multiple email addresses with commas. Since peps is
-    # sorted by PEP number, this should produce a deterministic
-    # output.
-    return {name: ', '.join(emails) for name, emails in authors_dict.items()}
-
-
-def _sort_authors(authors_dict: dict[str, str]) -> list[str]:
-    return sorted(authors_dict, key=_author_sort_by)
-
-
-def _author_sort_by(author_name: str) -> str:
-    """Skip lower-cased words in surname when sorting."""
-    surname, *_ = author_name.split(",")
-    surname_parts = surname.split()
-    for i, part in enumerate(surname_parts):
-        if part[0].isupper():
-            base = " ".join(surname_parts[i:]).lower()
-            return unicodedata.normalize("NFKD", base)
-    # If no capitals, use the whole string
-    return unicodedata.normalize("NFKD", surname.lower())
@@ -2,6 +2,8 @@ import importlib.util
 import sys
 from pathlib import Path
 
+import pytest
+
 _ROOT_PATH = Path(__file__, "..", "..", "..").resolve()
 PEP_ROOT = _ROOT_PATH / "peps"
 
@@ -10,3 +12,20 @@ CHECK_PEPS_PATH = _ROOT_PATH / "check-peps.py"
 spec = importlib.util.spec_from_file_location("check_peps", CHECK_PEPS_PATH)
 sys.modules["check_peps"] = check_peps = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(check_peps)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "benchmark: timing benchmark, only run with '-m benchmark'"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Benchmarks are slow and timing-dependent, so skip them unless selected
+    markexpr = config.option.markexpr or ""
+    if "benchmark" in markexpr and "not benchmark" not in markexpr:
+        return
+    skip_benchmark = pytest.mark.skip(reason="benchmark, run with '-m benchmark'")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,155 @@
+import pytest
+
+from pep_sphinx_extensions.pep_processor.html import pep_assets
+
+from ...conftest import PEP_ROOT
+
+STATIC_DIR = PEP_ROOT.parent / "pep_sphinx_extensions" / "pep_theme" / "static"
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ("a, b {\n    color: red;\n}\n", "a,b{color:red}"),
+        ("/* comment */\np { margin: 0 auto; }", "p{margin:0 auto}"),
+        (
+            ":root {\n    --light: ;\n    --dark: initial;\n}",
+            ":root{--light: ;--dark:initial}",
+        ),
+        (
+            '@charset "UTF-8";\na::after { content: " (" attr(href) ")"; }',
+            'a::after{content:" (" attr(href) ")"}',
+        ),
+        (
+            "@media (max-width: 40em) {\n    p { width: calc(100% - 1rem); }\n}",
+            "@media (max-width: 40em){p{width:calc(100% - 1rem)}}",
+        ),
+        # whitespace, punctuation, and comments inside strings are kept
+        ('a::before { content: "a  b ; }"; }', 'a::before{content:"a  b ; }"}'),
+        (
+            "p { background: url('my  image.png'); }",
+            "p{background:url('my  image.png')}",
+        ),
+        (
+            'a::after { content: "/* not a comment */"; }',
+            'a::after{content:"/* not a comment */"}',
+        ),
+        # the space before a colon is only significant in selectors
+        ("p { color : red ; }", "p{color:red}"),
+        ("nav a :hover { color : red }", "nav a :hover{color:red}"),
+        (
+            "/* don't */ a::after { content: '\\'  /*'; }",
+            "a::after{content:'\\'  /*'}",
+        ),
+    ],
+)
+def test_minify_css(test_input, expected):
+    assert pep_assets.minify_css(test_input) == expected
+
+
+def test_minify_js():
+    source = """\
+// A comment
+"use strict";
+
+/**
+ * A block comment
+ */
+function f () {
+    const x = 1  // trailing comment
+    element.innerHTML = `
+      <p>${x}</p>
+    `;
+}
+"""
+    expected = """\
+"use strict";
+function f () {
+const x = 1
+element.innerHTML = `
+      <p>${x}</p>
+    `;
+}"""
+    assert pep_assets.minify_js(source) == expected
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ("/* a */ foo();\nbar();\n/* b */", "foo();\nbar();"),
+        ("foo(/* a */ 1);\nbar(); /* b */ baz();", "foo( 1);\nbar();  baz();"),
+        ("a = b/* c */+d", "a = b +d"),
+        # a comment with a line break still separates the lines
+        ("a = 1 /* x\ny */ b = 2", "a = 1\nb = 2"),
+        # comments inside strings, template literals, and regular expressions are kept
+        ("s = '/* a */'; // b", "s = '/* a */';"),
+        ('s = "// a \\" /* b */"', 's = "// a \\" /* b */"'),
+        ("s = `/*\n  ${'`*/`'} // a\n`", "s = `/*\n  ${'`*/`'} // a\n`"),
+        (r"u = s.match(/^https?:\/\/[^/]*/) // c", r"u = s.match(/^https?:\/\/[^/]*/)"),
+        # a slash after a value is a division
+        ("x = a / b /* c */ / d", "x = a / b  / d"),
+        ("x = (a) / 2 // half", "x = (a) / 2"),
+        (r"return /a\/*b/.test(s)", r"return /a\/*b/.test(s)"),
+    ],
+)
+def test_minify_js_comments(test_input, expected):
+    assert pep_assets.minify_js(test_input) == expected
+
+
+def test_hashed_name():
+    name = pep_assets.hashed_name("pep.css", b"p{}")
+
+    assert name.startswith("pep.")
+    assert name.endswith(".css")
+    assert len(name) == len("pep..css") + pep_assets.HASH_LENGTH
+    assert pep_assets.hashed_name("pep.css", b"a{}") != name
+
+
+def test_write_theme_assets(tmp_path):
+    assets = pep_assets.write_theme_assets(
+        STATIC_DIR, tmp_path, {"pygments.css": ".highlight { color: red; }"}
+    )
+
+    assert set(assets) == {"pep.css", "pep.js", "pep_version_filter.js", "pygments.css"}
+    for path in assets.values():
+        assert path.startswith("_static/")
+        assert tmp_path.joinpath(path).is_file()
+
+    css = tmp_path.joinpath(assets["pep.css"]).read_text(encoding="utf-8")
+    assert css.count("@charset") == 1
+    assert "/*" not in css
+    js = tmp_path.joinpath(assets["pep.js"]).read_text(encoding="utf-8")
+    assert js.startswith('"use strict";')
+    assert "const setColourScheme" in js
+    assert (
+        tmp_path.joinpath(assets["pygments.css"]).read_text(encoding="utf-8")
+        == ".highlight{color:red}"
+    )
+
+    # unchanged contents keep the same names
+    assert (
+        pep_assets.write_theme_assets(
+            STATIC_DIR, tmp_path, {"pygments.css": ".highlight { color: red; }"}
+        )
+        == assets
+    )
+
+
+def test_write_theme_assets_removes_stale(tmp_path):
+    old = pep_assets.write_theme_assets(
+        STATIC_DIR, tmp_path, {"pygments.css": ".highlight { color: red; }"}
+    )
+    tmp_path.joinpath(f"{old['pygments.css']}.gz").write_bytes(b"")
+    tmp_path.joinpath("_static", "pygments_dark.0123456789.css").write_bytes(b"")
+
+    new = pep_assets.write_theme_assets(
+        STATIC_DIR, tmp_path, {"pygments.css": ".highlight { color: blue; }"}
+    )
+
+    assert new["pygments.css"] != old["pygments.css"]
+    assert not tmp_path.joinpath(old["pygments.css"]).exists()
+    assert not tmp_path.joinpath(f"{old['pygments.css']}.gz").exists()
+    assert tmp_path.joinpath(new["pygments.css"]).is_file()
+    assert tmp_path.joinpath(new["pep.css"]).is_file()
+    # other assets which share a prefix are kept
+    assert tmp_path.joinpath("_static", "pygments_dark.0123456789.css").is_file()
@@ -0,0 +1,88 @@
+import multiprocessing
+import os
+
+from pep_sphinx_extensions.pep_processor.html.pep_highlighter import (
+    CachedPygmentsBridge,
+)
+
+
+def test_highlight_block_cached(tmp_path):
+    highlighter = CachedPygmentsBridge("html", "tango", cache_dir=tmp_path)
+
+    first = highlighter.highlight_block("print('Hello, world!')", "python")
+    second = CachedPygmentsBridge("html", "tango", cache_dir=tmp_path).highlight_block(
+        "print('Hello, world!')", "python"
+    )
+
+    assert '<span class="nb">print</span>' in first
+    assert second == first
+    assert highlighter.misses == 1
+    assert len(list(tmp_path.glob("??/*"))) == 1
+
+
+def test_highlight_block_key(tmp_path):
+    highlighter = CachedPygmentsBridge("html", "tango", cache_dir=tmp_path)
+
+    highlighter.highlight_block("x = 1", "python")
+    highlighter.highlight_block("x = 1", "text")
+    highlighter.highlight_block("x = 1", "python", linenos=True)
+    highlighter.highlight_block("x = 1", "python")
+
+    assert (highlighter.hits, highlighter.misses) == (1, 3)
+
+
+def test_highlight_block_not_cached_on_warning(tmp_path):
+    highlighter = CachedPygmentsBridge("html", "tango", cache_dir=tmp_path)
+
+    highlighter.highlight_block("x = 1", "not-a-lexer")
+    highlighter.highlight_block("x = 1", "not-a-lexer")
+
+    assert highlighter.misses == 2
+    assert not list(tmp_path.glob("??/*"))
+
+
+def test_prune_unused(tmp_path, caplog):
+    earlier = CachedPygmentsBridge("html", "tango", cache_dir=tmp_path)
+    earlier.highlight_block("x = 1", "python")
+    earlier.highlight_block("y = 2", "python")
+    earlier.highlight_block("z = 3", "python")
+    for path in tmp_path.glob("??/*"):
+        os.utime(path, ns=(0, 0))
+
+    highlighter = CachedPygmentsBridge("html", "tango", cache_dir=tmp_path)
+    highlighter.highlight_block("x = 1", "python")  # hit
+    highlighter.highlight_block("w = 0", "python")  # miss
+    with caplog.at_level(15):  # sphinx.util.logging's VERBOSE level
+        highlighter.prune_unused()
+
+    assert len(list(tmp_path.glob("??/*"))) == 2
+    assert len(list(tmp_path.glob("??/"))) == 2  # empty shards are removed
+    assert "removed 2 unused code blocks" in caplog.text
+    assert (highlighter.hits, highlighter.misses) == (1, 1)
+    highlighter.highlight_block("x = 1", "python")
+    assert highlighter.hits == 2
+
+
+def test_log_hit_rate(tmp_path, caplog):
+    highlighter = CachedPygmentsBridge("html", "tango", cache_dir=tmp_path)
+    for _ in range(4):
+        highlighter.highlight_block("x = 1", "python")
+
+    with caplog.at_level(15):  # sphinx.util.logging's VERBOSE level
+        highlighter.log_hit_rate()
+
+    assert "3 of 4 code blocks cached (75%)" in caplog.text
+
+
+def test_hits_shared_with_forked_workers(tmp_path):
+    highlighter = CachedPygmentsBridge("html", "tango", cache_dir=tmp_path)
+    highlighter.highlight_block("x = 1", "python")
+
+    # Sphinx's parallel writers are forked from the main process
+    worker = multiprocessing.get_context("fork").Process(
+        target=highlighter.highlight_block, args=("x = 1", "python")
+    )
+    worker.start()
+    worker.join()
+
+    assert (highlighter.hits, highlighter.misses) == (1, 1)
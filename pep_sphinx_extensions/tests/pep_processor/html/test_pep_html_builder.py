@@ -0,0 +1,70 @@
+import os
+import time
+from types import SimpleNamespace
+
+from pep_sphinx_extensions.pep_processor.html.pep_html_builder import (
+    FileBuilder,
+    OutputPath,
+    load_write_stamp,
+    save_write_stamp,
+)
+
+
+def test_output_path_write_text(tmp_path):
+    path = OutputPath(tmp_path, "pep-0008.html")
+
+    path.write_text("<p>Café</p>", encoding="utf-8", errors="xmlcharrefreplace")
+    mtime = path.stat().st_mtime_ns
+    path.write_text("<p>Café</p>", encoding="utf-8", errors="xmlcharrefreplace")
+
+    assert path.stat().st_mtime_ns == mtime
+    assert path.read_text(encoding="utf-8") == "<p>Café</p>"
+
+
+def test_output_path_write_text_errors(tmp_path):
+    path = OutputPath(tmp_path, "pep-0008.html")
+
+    path.write_text("<p>Café</p>", encoding="ascii", errors="xmlcharrefreplace")
+
+    assert path.read_bytes() == b"<p>Caf&#233;</p>"
+
+
+def _builder(tmp_path):
+    source = tmp_path / "pep-0008.rst"
+    source.write_text("PEP 8", encoding="utf-8")
+    output = tmp_path / "pep-0008.html"
+    output.write_text("<p>PEP 8</p>", encoding="utf-8")
+    os.utime(output, ns=(0, 0))  # kept from an earlier build, as the page is unchanged
+    env = SimpleNamespace(
+        all_docs={"pep-0008": 0}, doc2path=lambda docname: tmp_path / f"{docname}.rst"
+    )
+    builder = SimpleNamespace(
+        env=env, get_output_path=lambda docname: tmp_path / f"{docname}.html"
+    )
+    return builder, output
+
+
+def test_written_since(tmp_path):
+    now = time.time_ns() // 1000
+    builder, output = _builder(tmp_path)
+
+    assert FileBuilder._written_since(builder, "pep-0008", now + 10**6, 0)
+    # Sources or templates changed after the last build
+    assert not FileBuilder._written_since(builder, "pep-0008", now - 10**7, 0)
+    assert not FileBuilder._written_since(
+        builder, "pep-0008", now + 10**6, now + 2 * 10**6
+    )
+    # Missing outputs, and documents new to the environment
+    assert not FileBuilder._written_since(builder, "pep-0020", now + 10**6, 0)
+    output.unlink()
+    assert not FileBuilder._written_since(builder, "pep-0008", now + 10**6, 0)
+
+
+def test_write_stamp(tmp_path):
+    assert load_write_stamp(tmp_path, []) is None
+
+    save_write_stamp(tmp_path, 123, ["b", "a"])
+
+    assert load_write_stamp(tmp_path, ["a", "b"]) == 123
+    # Different tags may change every page
+    assert load_write_stamp(tmp_path, ["a"]) is None
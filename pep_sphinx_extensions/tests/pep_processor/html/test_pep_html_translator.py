@@ -0,0 +1,150 @@
+import timeit
+
+import pytest
+from docutils import nodes
+from docutils.frontend import get_default_settings
+from docutils.utils import new_document
+from sphinx.application import Sphinx
+from sphinx.writers.html import HTMLWriter
+
+from pep_sphinx_extensions.pep_processor.html.pep_html_translator import PEPTranslator
+
+
+@pytest.fixture(scope="module")
+def builder(tmp_path_factory):
+    src_dir = tmp_path_factory.mktemp("src")
+    src_dir.joinpath("conf.py").write_text("", encoding="utf-8")
+    src_dir.joinpath("index.rst").write_text("", encoding="utf-8")
+    app = Sphinx(
+        src_dir, src_dir, src_dir / "html", src_dir / "doctrees", "html", status=None
+    )
+    app.builder.current_docname = "index"
+    app.builder.secnumbers = app.builder.fignumbers = {}
+    return app.builder
+
+
+def _translate(builder, *children: nodes.Node) -> str:
+    document = new_document("<test>", get_default_settings(HTMLWriter(builder)))
+    document.extend(children)
+    translator = PEPTranslator(document, builder)
+    document.walkabout(translator)
+    return "".join(translator.body)
+
+
+def test_compact_paragraph(builder):
+    item = nodes.list_item(
+        "", nodes.target(), nodes.paragraph("", "one"), nodes.paragraph("", "two")
+    )
+    out = _translate(builder, nodes.bullet_list("", item))
+
+    assert '<li><span class="target"></span>one<p>two</p>' in out.replace("\n", "")
+
+
+def test_compact_paragraph_not_in_document(builder):
+    out = _translate(builder, nodes.paragraph("", "one"))
+
+    assert out == "<p>one</p>\n"
+
+
+def test_compact_paragraph_custom_attributes(builder):
+    item = nodes.list_item("", nodes.paragraph("", "one", classes=["custom"]))
+    out = _translate(builder, nodes.bullet_list("", item))
+
+    assert '<p class="custom">one</p>' in out
+
+
+def _table() -> nodes.table:
+    entry = nodes.entry("", nodes.paragraph("", "cell"))
+    return nodes.table(
+        "",
+        nodes.tgroup(
+            "", nodes.colspec(colwidth=1), nodes.tbody("", nodes.row("", entry)), cols=1
+        ),
+    )
+
+
+def test_table_wrapped_in_pep_content(builder):
+    out = _translate(builder, nodes.section("", _table(), ids=["pep-content"]))
+
+    assert '<div class="table-wrapper">\n<table' in out
+    assert "</table>\n</div>\n" in out
+
+
+def test_table_not_wrapped_outside_pep_content(builder):
+    out = _translate(builder, nodes.section("", _table(), ids=["numerical-index"]))
+
+    assert "<table" in out
+    assert "table-wrapper" not in out
+
+
+@pytest.mark.parametrize(
+    ("bullet_list", "parents"),
+    [
+        # Many list items, each with one paragraph
+        (
+            nodes.bullet_list(
+                "",
+                *(
+                    nodes.list_item("", nodes.paragraph("", f"{i}"))
+                    for i in range(1_000)
+                ),
+            ),
+            1_000,
+        ),
+        # One list item with many paragraphs
+        (
+            nodes.bullet_list(
+                "",
+                nodes.list_item(
+                    "", *(nodes.paragraph("", f"{i}") for i in range(1_000))
+                ),
+            ),
+            1,
+        ),
+    ],
+    ids=["items", "paragraphs"],
+)
+def test_compact_paragraph_linear_time(builder, monkeypatch, bullet_list, parents):
+    first_visible_child = PEPTranslator._first_visible_child
+    scanned = []
+
+    def spy(self, parent):
+        if parent not in self._first_visible_children:
+            scanned.append(parent)
+        return first_visible_child(self, parent)
+
+    monkeypatch.setattr(PEPTranslator, "_first_visible_child", spy)
+    _translate(builder, bullet_list)
+
+    # The children of each parent are scanned once, not once per paragraph
+    assert len(scanned) == len(set(scanned)) == parents
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "make_list",
+    [
+        # Many list items, each with one paragraph
+        lambda n: nodes.bullet_list(
+            "", *(nodes.list_item("", nodes.paragraph("", f"{i}")) for i in range(n))
+        ),
+        # One list item with many paragraphs
+        lambda n: nodes.bullet_list(
+            "", nodes.list_item("", *(nodes.paragraph("", f"{i}") for i in range(n)))
+        ),
+    ],
+    ids=["items", "paragraphs"],
+)
+def test_compact_paragraph_benchmark(builder, make_list):
+    def best_time(n):
+        return min(
+            timeit.repeat(lambda: _translate(builder, make_list(n)), number=1, repeat=3)
+        )
+
+    half, full = best_time(5_000), best_time(10_000)
+    print(
+        f"\n5,000 paragraphs: {half * 1000:.1f} ms, 10,000 paragraphs: {full * 1000:.1f} ms"
+    )
+
+    # Doubling the size should roughly double the time, not quadruple it
+    assert full < 3 * half
@@ -31,3 +31,23 @@ def test_get_last_modified_timestamps():
     assert len(out) >= 585
     # Should be a Unix timestamp and at least this
     assert dt.datetime.fromisoformat(out["pep-0008"]).timestamp() >= 1643124055
+
+
+def test_get_recently_modified(monkeypatch):
+    monkeypatch.setattr(
+        pep_footer,
+        "_LAST_MODIFIED_TIMES",
+        {
+            "pep-0001": "2024-01-01 00:00:00",
+            "pep-0002": "",
+            "pep-0003": "2025-01-01 00:00:00",
+            "pep-0004": "2024-01-01 00:00:00",
+            "pep-0005": "2023-01-01 00:00:00",
+        },
+    )
+
+    assert pep_footer.get_recently_modified(3) == [
+        ("pep-0003", "2025-01-01 00:00:00"),
+        ("pep-0004", "2024-01-01 00:00:00"),
+        ("pep-0001", "2024-01-01 00:00:00"),
+    ]
@@ -1,3 +1,7 @@
+import re
+import timeit
+from email.parser import HeaderParser
+
 import pytest
 
 from pep_sphinx_extensions.pep_processor.transforms import pep_headers
@@ -16,6 +20,13 @@ from pep_sphinx_extensions.pep_zero_generator.constants import (
     TYPE_STANDARDS,
 )
 
+from ...conftest import PEP_ROOT
+
+# Links in the headers which PEPHeaders prettifies, as docutils resolves them
+HEADER_LINK = re.compile(
+    r"(?:https?://|mailto:)[^\s<>`,]+|[\w.+-]+@[\w-]+(?:\.[\w-]+)+"
+)
+
 
 @pytest.mark.parametrize(
     ("test_input", "expected"),
@@ -128,6 +139,37 @@ def test_make_link_pretty(test_input, expected):
     assert out == expected
 
 
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (
+            "https://discuss.python.org/t/pep-643-metadata-for-package-source-distributions/5577",
+            (
+                "https://discuss.python.org/t/pep-643-metadata-for-package-source-distributions/5577",
+                "Discourse thread",
+            ),
+        ),
+        (
+            "mailto:python-dev@python.org",
+            (
+                "https://mail.python.org/archives/list/python-dev@python.org/",
+                "Python-Dev list",
+            ),
+        ),
+        (
+            "https://github.com/python/peps/issues/1",
+            ("https://github.com/python/peps/issues/1", None),
+        ),
+        ("mailto:someone@example.com", ("mailto:someone@example.com", None)),
+        ("pep-0008", ("pep-0008", None)),
+    ],
+)
+def test_classify_link(test_input, expected):
+    out = pep_headers._classify_link(test_input)
+
+    assert out == expected
+
+
 @pytest.mark.parametrize(
     ("test_input", "expected"),
     [
@@ -183,3 +225,62 @@ def test_abbreviate_type(test_input, expected):
 def test_abbreviate_type_unknown():
     with pytest.raises(pep_headers.PEPParsingError):
         pep_headers._abbreviate_type("an unknown type")
+
+
+def _corpus_header_links():
+    links = []
+    for path in sorted(PEP_ROOT.glob("pep-????.rst")):
+        with open(path, encoding="utf-8") as file:
+            headers = HeaderParser().parse(file)
+        for name in "Discussions-To", "Post-History", "Resolution":
+            for link in HEADER_LINK.findall(headers.get(name, "")):
+                links.append(
+                    link
+                    if "://" in link or link.startswith("mailto:")
+                    else f"mailto:{link}"
+                )
+    return links
+
+
+def _classify_link_unmemoised(refuri):
+    # The classification before _classify_link, which split every URL
+    if refuri.lower().startswith("mailto:"):
+        refuri = pep_headers._generate_list_url(refuri)
+    parts = refuri.lower().split("/")
+    if len(parts) <= 2 or parts[2] not in pep_headers.LINK_PRETTIFIERS:
+        return refuri, None
+    return refuri, pep_headers._make_link_pretty(refuri)
+
+
+@pytest.mark.benchmark
+def test_classify_link_benchmark():
+    links = _corpus_header_links()
+
+    def classify_cold():
+        pep_headers._classify_link.cache_clear()
+        return [pep_headers._classify_link(link) for link in links]
+
+    before = min(
+        timeit.repeat(
+            lambda: [_classify_link_unmemoised(link) for link in links],
+            number=1,
+            repeat=5,
+        )
+    )
+    cold = min(timeit.repeat(classify_cold, number=1, repeat=5))
+    warm = min(
+        timeit.repeat(
+            lambda: [pep_headers._classify_link(link) for link in links],
+            number=1,
+            repeat=5,
+        )
+    )
+    print(
+        f"\n{len(links)} header links ({len(set(links))} distinct): before {before * 1000:.2f} ms, "
+        f"cold cache {cold * 1000:.2f} ms, warm cache {warm * 1000:.2f} ms"
+    )
+
+    assert [pep_headers._classify_link(link) for link in links] == [
+        _classify_link_unmemoised(link) for link in links
+    ]
+    assert warm < before
@@ -0,0 +1,76 @@
+from docutils import nodes
+from docutils.core import publish_doctree
+
+from pep_sphinx_extensions.pep_processor.transforms import pep_slim_doctree
+
+SOURCE = """\
+Abstract
+========
+
+A paragraph with *emphasis* and ``literal`` text.
+
+.. code-block:: python
+
+    print("Hello, world!")
+
+::
+
+    A literal block.
+"""
+
+
+def test_slim_doctree():
+    document = publish_doctree(SOURCE)
+    document["headers"] = {"PEP": "8"}
+    text = document.astext()
+
+    pep_slim_doctree.slim_doctree(document)
+
+    for node in document.findall(nodes.Element):
+        if isinstance(node, nodes.FixedTextElement):
+            assert node.rawsource
+        else:
+            assert node.rawsource == ""
+    assert document.astext() == text
+    assert document["headers"] == {"PEP": "8"}
+
+
+def test_slim_doctree_maths():
+    # Built by hand, as Sphinx replaces the docutils maths directive globally
+    math = nodes.math("a^2 + b^2", "a^2 + b^2")
+    math_block = nodes.math_block("c^2", "c^2")
+    document = publish_doctree(SOURCE)
+    document += [nodes.paragraph("", "", math), math_block]
+
+    pep_slim_doctree.slim_doctree(document)
+
+    assert math.rawsource == ""
+    assert math.astext() == "a^2 + b^2"
+    assert math_block.rawsource == "c^2"
+
+
+def test_slim_doctree_keeps_source_and_line():
+    document = publish_doctree(SOURCE, source_path="pep-9999.rst")
+    before = [(node.source, node.line) for node in document.findall(nodes.Element)]
+
+    pep_slim_doctree.slim_doctree(document)
+
+    assert [
+        (node.source, node.line) for node in document.findall(nodes.Element)
+    ] == before
+
+
+def test_log_doctree_size(tmp_path, caplog):
+    tmp_path.joinpath("pep-0008.doctree").write_bytes(b"x" * 2**20)
+    tmp_path.joinpath("api").mkdir()
+    tmp_path.joinpath("api", "index.doctree").write_bytes(b"x" * 2**19)
+    tmp_path.joinpath("environment.pickle").write_bytes(b"x" * 2**19)
+    # other build caches are not counted
+    tmp_path.joinpath("pep-metadata.store").write_bytes(b"x" * 2**20)
+    tmp_path.joinpath("highlight", "ab").mkdir(parents=True)
+    tmp_path.joinpath("highlight", "ab", "cdef").write_bytes(b"x" * 2**20)
+
+    with caplog.at_level("INFO"):
+        pep_slim_doctree.log_doctree_size(tmp_path)
+
+    assert "3 files, 2.0 MiB" in caplog.text
@@ -0,0 +1,142 @@
+import re
+import timeit
+
+import pytest
+from docutils import nodes, utils
+from docutils.parsers.rst import roles, states
+
+from pep_sphinx_extensions.pep_processor.transforms import pep_title
+
+from ...conftest import PEP_ROOT
+
+
+def _parse_with_state_machine(text):
+    # Parse a title with a full docutils state machine, as before the fast path
+    document = utils.new_document("<inline-rst>")
+    document.settings.pep_references = document.settings.rfc_references = False
+    states.RSTStateMachine(
+        state_classes=states.state_classes, initial_state="Body"
+    ).run([text], document)
+    roles._roles.pop("", None)
+    return document[0].children
+
+
+def _corpus_titles():
+    titles = []
+    for path in sorted(PEP_ROOT.glob("pep-????.rst")):
+        match = re.search(
+            r"^Title: (.*)$", path.read_text(encoding="utf-8"), re.MULTILINE
+        )
+        if match is not None:
+            number = int(path.stem.removeprefix("pep-"))
+            titles.append(f"PEP {number} -- {match[1]}")
+    return titles
+
+
+def test_line_to_nodes_plain_text():
+    out = pep_title._line_to_nodes("PEP 8 -- Style Guide for Python Code")
+
+    assert len(out) == 1
+    assert isinstance(out[0], nodes.Text)
+    assert out[0] == "PEP 8 -- Style Guide for Python Code"
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (
+            "PEP 604 -- Allow writing union types as ``X | Y``",
+            [nodes.Text, nodes.literal],
+        ),
+        (
+            "PEP 645 -- Allow writing optional types as ``x?``",
+            [nodes.Text, nodes.literal],
+        ),
+        (
+            "PEP 468 -- Preserving the order of \\*\\*kwargs in a function.",
+            [nodes.Text],
+        ),
+    ],
+)
+def test_line_to_nodes_inline_markup(test_input, expected):
+    out = pep_title._line_to_nodes(test_input)
+
+    assert [type(node) for node in out] == expected
+
+
+def test_line_to_nodes_escapes():
+    out = pep_title._line_to_nodes(
+        "PEP 468 -- Preserving the order of \\*\\*kwargs in a function."
+    )
+
+    assert (
+        "".join(node.astext() for node in out)
+        == "PEP 468 -- Preserving the order of **kwargs in a function."
+    )
+
+
+def test_line_to_nodes_independent_documents():
+    title = "PEP 9999 -- Use `Example <https://example.com>`_ titles"
+
+    first = pep_title._line_to_nodes(title)
+    second = pep_title._line_to_nodes(title)
+
+    # Each title is parsed in its own document, so ids do not become "example-1"
+    assert [node.get("ids") for node in first if isinstance(node, nodes.Element)] == [
+        [],
+        ["example"],
+    ]
+    assert [node.get("ids") for node in second if isinstance(node, nodes.Element)] == [
+        [],
+        ["example"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "title",
+    [
+        "PEP 8 -- Style Guide for Python Code",
+        "PEP 604 -- Allow writing union types as ``X | Y``",
+        "PEP 468 -- Preserving the order of \\*\\*kwargs in a function.",
+        "PEP 9999 -- Use `Example <https://example.com>`_ titles",
+        "PEP 9999 -- See https://example.com",
+    ],
+)
+def test_line_to_nodes_matches_state_machine(title):
+    out = pep_title._line_to_nodes(title)
+
+    assert [node.pformat() for node in out] == [
+        node.pformat() for node in _parse_with_state_machine(title)
+    ]
+
+
+@pytest.mark.benchmark
+def test_line_to_nodes_benchmark():
+    titles = _corpus_titles()
+
+    before = min(
+        timeit.repeat(
+            lambda: [_parse_with_state_machine(title) for title in titles],
+            number=1,
+            repeat=5,
+        )
+    )
+    after = min(
+        timeit.repeat(
+            lambda: [pep_title._line_to_nodes(title) for title in titles],
+            number=1,
+            repeat=5,
+        )
+    )
+    fast_path = sum(
+        pep_title.INLINE_MARKUP_CANDIDATES.search(title) is None for title in titles
+    )
+    print(
+        f"\n{len(titles)} titles ({fast_path} without markup): "
+        f"state machine {before * 1000:.1f} ms, _line_to_nodes {after * 1000:.1f} ms"
+    )
+
+    for title in titles:
+        expected = [node.pformat() for node in _parse_with_state_machine(title)]
+        assert [node.pformat() for node in pep_title._line_to_nodes(title)] == expected
+    assert after < before
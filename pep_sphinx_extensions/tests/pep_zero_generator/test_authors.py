@@ -0,0 +1,133 @@
+import json
+import timeit
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from pep_sphinx_extensions.pep_zero_generator import authors, parser
+
+
+def test_build_author_index():
+    # Arrange
+    peps = [
+        parser.PEP(Path("pep_sphinx_extensions/tests/peps/pep-9000.rst")),
+        parser.PEP(Path("pep_sphinx_extensions/tests/peps/pep-9001.rst")),
+        parser.PEP(Path("pep_sphinx_extensions/tests/peps/pep-9003.rst")),
+    ]
+
+    # Act
+    out = authors.build_author_index(peps)
+
+    # Assert
+    assert list(out) == ["Francis Fussyreverend", "Javier Soulfulcommodore"]
+    assert out["Francis Fussyreverend"].emails == [
+        "one@example.com",
+        "different@example.com",
+    ]
+    assert out["Francis Fussyreverend"].peps == [9000, 9001, 9003]
+    assert out["Javier Soulfulcommodore"].emails == ["two@example.com"]
+    assert out["Francis Fussyreverend"].sort_key == "francis fussyreverend"
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        (
+            ["pep-9000.rst"],
+            {
+                "Francis Fussyreverend": ["one@example.com"],
+                "Javier Soulfulcommodore": ["two@example.com"],
+            },
+        ),
+        (
+            ["pep-9001.rst"],
+            {"Francis Fussyreverend": [], "Javier Soulfulcommodore": []},
+        ),
+        (
+            # Francis's emails are combined, Javier's is not duplicated
+            ["pep-9000.rst", "pep-9003.rst"],
+            {
+                "Francis Fussyreverend": ["one@example.com", "different@example.com"],
+                "Javier Soulfulcommodore": ["two@example.com"],
+            },
+        ),
+    ],
+)
+def test_build_author_index_emails(test_input, expected):
+    peps = [
+        parser.PEP(Path(f"pep_sphinx_extensions/tests/peps/{name}"))
+        for name in test_input
+    ]
+
+    out = authors.build_author_index(peps)
+
+    assert {name: entry.emails for name, entry in out.items()} == expected
+
+
+def test_author_sort_key_order():
+    names = ["Zebra, Zoë", "lowercase, laurence", "Aardvark, Alfred"]
+
+    out = sorted(names, key=authors.author_sort_key)
+
+    assert out == ["Aardvark, Alfred", "lowercase, laurence", "Zebra, Zoë"]
+
+
+def test_create_authors_json():
+    peps = [parser.PEP(Path("pep_sphinx_extensions/tests/peps/pep-9000.rst"))]
+
+    out = json.loads(authors.create_authors_json(authors.build_author_index(peps)))
+
+    assert out == {
+        "Francis Fussyreverend": {"emails": ["one@example.com"], "peps": [9000]},
+        "Javier Soulfulcommodore": {"emails": ["two@example.com"], "peps": [9000]},
+    }
+
+
+@pytest.mark.parametrize(
+    ("test_input", "expected"),
+    [
+        ("Aardvark, Alfred", "aardvark"),
+        ("van Rossum, Guido", "rossum"),
+        ("lowercase, laurence", "lowercase"),
+        ("Zebra, Zoë", "zebra"),
+        # Decomposed for sorting
+        ("Émile Zola", "e\u0301mile zola"),
+    ],
+)
+def test_author_sort_key(test_input, expected):
+    assert authors.author_sort_key(test_input) == expected
+
+
+@pytest.mark.benchmark
+def test_build_author_index_benchmark():
+    # 10,000 synthetic PEPs with 5,000 authors, two authors each
+    peps = [
+        SimpleNamespace(
+            number=number,
+            authors=[
+                parser._Author(
+                    f"Surname{number % 2500:04}, Author",
+                    f"a{number % 2500}@example.com",
+                ),
+                parser._Author(f"Zola{(number * 7) % 2500:04}, Émile", ""),
+            ],
+        )
+        for number in range(10_000)
+    ]
+
+    index_time = min(
+        timeit.repeat(lambda: authors.build_author_index(peps), number=1, repeat=5)
+    )
+    author_index = authors.build_author_index(peps)
+    json_time = min(
+        timeit.repeat(
+            lambda: authors.create_authors_json(author_index), number=1, repeat=5
+        )
+    )
+    print(
+        f"\nbuild_author_index: {index_time * 1000:.1f} ms, create_authors_json: {json_time * 1000:.1f} ms"
+    )
+
+    assert len(author_index) == 5_000
+    assert list(author_index) == sorted(author_index, key=authors.author_sort_key)
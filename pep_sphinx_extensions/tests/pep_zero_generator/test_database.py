@@ -0,0 +1,54 @@
+import sqlite3
+
+from pep_sphinx_extensions.pep_zero_generator import database, parser
+
+from ..conftest import PEP_ROOT
+
+
+def _connect(peps):
+    connection = sqlite3.connect(":memory:")
+    connection.deserialize(database.create_pep_database(peps))
+    return connection
+
+
+def test_create_pep_database_peps():
+    connection = _connect([parser.PEP(PEP_ROOT / "pep-3124.rst")])
+
+    row = connection.execute(
+        "SELECT number, status, type, created FROM peps"
+    ).fetchone()
+
+    assert row == (3124, "Deferred", "Standards Track", "2007-04-28")
+
+
+def test_create_pep_database_normalised_tables():
+    connection = _connect(
+        [
+            parser.PEP(PEP_ROOT / "pep-0012.rst"),
+            parser.PEP(PEP_ROOT / "pep-0361.rst"),
+            parser.PEP(PEP_ROOT / "pep-3124.rst"),
+        ]
+    )
+
+    authors = connection.execute(
+        "SELECT name FROM authors JOIN pep_authors ON id = author "
+        "WHERE pep = 12 ORDER BY position"
+    ).fetchall()
+    versions = connection.execute(
+        "SELECT version FROM versions WHERE pep = 361 ORDER BY version"
+    ).fetchall()
+    topics = connection.execute("SELECT topic FROM topics WHERE pep = 361").fetchall()
+    requires = connection.execute(
+        "SELECT target FROM cross_references WHERE pep = 3124 AND relation = 'requires' ORDER BY target"
+    ).fetchall()
+
+    assert authors == [("David Goodger",), ("Barry Warsaw",), ("Brett Cannon",)]
+    assert versions == [("2.6",), ("3.0",)]
+    assert topics == [("release",)]
+    assert requires == [(3107,), (3115,), (3119,)]
+
+
+def test_create_pep_database_reproducible():
+    peps = [parser.PEP(PEP_ROOT / "pep-0008.rst")]
+
+    assert database.create_pep_database(peps) == database.create_pep_database(peps)
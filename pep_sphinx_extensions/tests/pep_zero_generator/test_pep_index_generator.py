@@ -1,3 +1,7 @@
+import json
+from types import SimpleNamespace
+
+from pep_sphinx_extensions import artifacts
 from pep_sphinx_extensions.pep_zero_generator import parser, pep_index_generator
 
 from ..conftest import PEP_ROOT
@@ -19,3 +23,154 @@ def test_build_release_peps_links_individual_versions_from_joint_release_pep():
     release_peps = pep_index_generator.build_release_peps(peps)
 
     assert release_peps == {"2.6": 361, "3.0": 361}
+
+
+def test_diff_peps_json():
+    old = {
+        "1": {"number": 1, "status": "Active"},
+        "2": {"number": 2, "status": "Draft"},
+        "3": {"number": 3, "status": "Draft"},
+    }
+    new = {
+        "1": {"number": 1, "status": "Active"},
+        "3": {"number": 3, "status": "Final", "resolution": "https://example.com"},
+        "10": {"number": 10, "status": "Draft"},
+    }
+
+    out = pep_index_generator.diff_peps_json(old, new)
+
+    assert out == {
+        "added": [10],
+        "removed": [2],
+        "changed": {
+            "3": {
+                "resolution": {"old": None, "new": "https://example.com"},
+                "status": {"old": "Draft", "new": "Final"},
+            },
+        },
+    }
+
+
+def test_write_peps_json_records_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    changes_path = tmp_path / "api" / "peps-changes.json"
+    peps = [parser.PEP(PEP_ROOT / "pep-0008.rst")]
+
+    # First build: nothing to compare against
+    pep_index_generator.write_peps_json(peps, tmp_path)
+    assert json.loads(changes_path.read_text(encoding="utf-8")) == {"changes": []}
+
+    # Unchanged build: nothing recorded
+    pep_index_generator.write_peps_json(peps, tmp_path)
+    assert json.loads(changes_path.read_text(encoding="utf-8")) == {"changes": []}
+
+    # Added PEP
+    peps.append(parser.PEP(PEP_ROOT / "pep-0020.rst"))
+    pep_index_generator.write_peps_json(peps, tmp_path)
+    changes = json.loads(changes_path.read_text(encoding="utf-8"))["changes"]
+    assert len(changes) == 1
+    assert changes[0]["added"] == [20]
+    assert changes[0]["removed"] == []
+    assert changes[0]["changed"] == {}
+
+
+def test_write_peps_changes_window(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    monkeypatch.setattr(pep_index_generator, "CHANGES_WINDOW", 2)
+    changes_path = tmp_path / "api" / "peps-changes.json"
+
+    previous = {}
+    for number in range(1, 5):
+        current = {**previous, str(number): {"number": number}}
+        pep_index_generator.write_peps_changes(previous, current, tmp_path)
+        previous = current
+
+    changes = json.loads(changes_path.read_text(encoding="utf-8"))["changes"]
+    # Newest first, bounded by the window
+    assert [change["added"] for change in changes] == [[4], [3]]
+
+
+def test_header_fingerprint(tmp_path):
+    pep_path = tmp_path / "pep-9999.rst"
+    pep_path.write_text("PEP: 9999\nTitle: Example\n\nBody text.\n", encoding="utf-8")
+    original = pep_index_generator.header_fingerprint(tmp_path, "html")
+
+    # Body-only edits and PEP 0 don't change the fingerprint
+    pep_path.write_text(
+        "PEP: 9999\nTitle: Example\n\nNew body text.\n", encoding="utf-8"
+    )
+    (tmp_path / "pep-0000.rst").write_text("PEP: 0\n\nIndex\n", encoding="utf-8")
+    assert pep_index_generator.header_fingerprint(tmp_path, "html") == original
+
+    # Builder or header changes do
+    assert pep_index_generator.header_fingerprint(tmp_path, "dirhtml") != original
+    pep_path.write_text(
+        "PEP: 9999\nTitle: New Example\n\nNew body text.\n", encoding="utf-8"
+    )
+    assert pep_index_generator.header_fingerprint(tmp_path, "html") != original
+
+
+def test_header_fingerprint_header_block(tmp_path):
+    pep_path = tmp_path / "pep-9999.rst"
+    pep_path.write_text("PEP: 9999\nTitle: Example\n\nBody text.\n", encoding="utf-8")
+    original = pep_index_generator.header_fingerprint(tmp_path, "html")
+
+    # Line endings and extra blank lines after the headers don't matter
+    pep_path.write_bytes(b"PEP: 9999\r\nTitle: Example\r\n\r\nBody text.\r\n")
+    assert pep_index_generator.header_fingerprint(tmp_path, "html") == original
+    pep_path.write_text(
+        "PEP: 9999\nTitle: Example\n\n\n\nNew body text.\n", encoding="utf-8"
+    )
+    assert pep_index_generator.header_fingerprint(tmp_path, "html") == original
+
+
+def test_header_fingerprint_source(tmp_path, monkeypatch):
+    (tmp_path / "pep-9999.rst").write_text(
+        "PEP: 9999\nTitle: Example\n\nBody text.\n", encoding="utf-8"
+    )
+    extension_dir = tmp_path / "extension"
+    extension_dir.mkdir()
+    (extension_dir / "pep_headers.py").write_text(
+        "ABBREVIATED_STATUSES = {}\n", encoding="utf-8"
+    )
+    monkeypatch.setattr(pep_index_generator, "EXTENSION_DIR", extension_dir)
+    original = pep_index_generator.header_fingerprint(tmp_path, "html")
+
+    # Changes to any module of the extension change the fingerprint, except tests
+    (extension_dir / "tests").mkdir()
+    (extension_dir / "tests" / "test_pep_headers.py").write_text("", encoding="utf-8")
+    assert pep_index_generator.header_fingerprint(tmp_path, "html") == original
+    (extension_dir / "pep_headers.py").write_text(
+        "ABBREVIATED_STATUSES = {1: 2}\n", encoding="utf-8"
+    )
+    assert pep_index_generator.header_fingerprint(tmp_path, "html") != original
+
+
+def test_is_up_to_date(tmp_path):
+    srcdir, outdir = tmp_path / "src", tmp_path / "html"
+    for docname in pep_index_generator._generated_docnames():
+        srcdir.joinpath(f"{docname}.rst").parent.mkdir(parents=True, exist_ok=True)
+        srcdir.joinpath(f"{docname}.rst").write_text("", encoding="utf-8")
+    for name in "api/peps.json", "api/peps.sqlite", "release-schedule-3.14.ics":
+        outdir.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+        outdir.joinpath(name).write_bytes(b"")
+    env = SimpleNamespace(
+        pep_zero_fingerprint="abc",
+        pep_zero_artifacts=[
+            "api/peps.json",
+            "api/peps.sqlite",
+            "release-schedule-3.14.ics",
+        ],
+    )
+
+    assert pep_index_generator.is_up_to_date(env, srcdir, outdir, "abc")
+    assert not pep_index_generator.is_up_to_date(env, srcdir, outdir, "def")
+
+    # Any missing artifact, not only peps.json, triggers regeneration
+    outdir.joinpath("release-schedule-3.14.ics").unlink()
+    assert not pep_index_generator.is_up_to_date(env, srcdir, outdir, "abc")
+
+    # As does an environment without the list of artifacts
+    assert not pep_index_generator.is_up_to_date(
+        SimpleNamespace(pep_zero_fingerprint="abc"), srcdir, outdir, "abc"
+    )
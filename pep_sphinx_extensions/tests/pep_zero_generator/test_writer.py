@@ -1,8 +1,6 @@
-from pathlib import Path
-
 import pytest
 
-from pep_sphinx_extensions.pep_zero_generator import parser, writer
+from pep_sphinx_extensions.pep_zero_generator import writer
 
 
 def test_pep_zero_writer_emit_text_newline():
@@ -29,65 +27,6 @@ def test_pep_zero_writer_emit_title():
     ]
 
 
-@pytest.mark.parametrize(
-    ("test_input", "expected"),
-    [
-        (
-            "pep-9000.rst",
-            {
-                "Francis Fussyreverend": "one@example.com",
-                "Javier Soulfulcommodore": "two@example.com",
-            },
-        ),
-        (
-            "pep-9001.rst",
-            {"Francis Fussyreverend": "", "Javier Soulfulcommodore": ""},
-        ),
-    ],
-)
-def test_verify_email_addresses(test_input, expected):
-    # Arrange
-    peps = [parser.PEP(Path(f"pep_sphinx_extensions/tests/peps/{test_input}"))]
-
-    # Act
-    out = writer._verify_email_addresses(peps)
-
-    # Assert
-    assert out == expected
-
-
-def test_verify_email_addresses_multiple_emails():
-    # Arrange
-    peps = [
-        parser.PEP(Path("pep_sphinx_extensions/tests/peps/pep-9000.rst")),
-        parser.PEP(Path("pep_sphinx_extensions/tests/peps/pep-9003.rst")),
-    ]
-
-    # Act
-    out = writer._verify_email_addresses(peps)
-
-    # Assert: Francis has two emails combined, Javier's single email is not duplicated
-    assert out == {
-        "Francis Fussyreverend": "one@example.com, different@example.com",
-        "Javier Soulfulcommodore": "two@example.com",
-    }
-
-
-def test_sort_authors():
-    # Arrange
-    authors_dict = {
-        "Zebra, Zoë": "zoe@example.com",
-        "lowercase, laurence": "laurence@example.com",
-        "Aardvark, Alfred": "alfred@example.com",
-    }
-
-    # Act
-    out = writer._sort_authors(authors_dict)
-
-    # Assert
-    assert out == ["Aardvark, Alfred", "lowercase, laurence", "Zebra, Zoë"]
-
-
 @pytest.mark.parametrize(
     ("python_version", "expected"),
     [
@@ -0,0 +1,215 @@
+import gzip
+import json
+
+from pep_sphinx_extensions import artifacts
+
+
+def test_write_if_changed(tmp_path):
+    path = tmp_path / "api" / "file.txt"
+
+    assert artifacts.write_if_changed(path, b"content")
+    mtime = path.stat().st_mtime_ns
+    assert not artifacts.write_if_changed(path, b"content")
+    assert path.stat().st_mtime_ns == mtime
+    assert artifacts.write_if_changed(path, b"new content")
+    assert path.read_bytes() == b"new content"
+
+
+def test_write_artifact_json_variants(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    text = json.dumps({"1": {"number": 1, "title": "PEP Purpose"}}, indent=1)
+
+    artifacts.write_artifact(tmp_path, "api/peps.json", text)
+
+    assert (tmp_path / "api" / "peps.json").read_text(encoding="utf-8") == text
+    minified = (tmp_path / "api" / "peps.min.json").read_text(encoding="utf-8")
+    assert minified == '{"1":{"number":1,"title":"PEP Purpose"}}'
+    gzipped = (tmp_path / "api" / "peps.json.gz").read_bytes()
+    assert gzip.decompress(gzipped) == text.encode("utf-8")
+    assert {
+        "api/peps.json",
+        "api/peps.json.gz",
+        "api/peps.min.json",
+        "api/peps.min.json.gz",
+    } <= artifacts._manifest.keys()
+
+
+def test_write_artifact_reproducible(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+
+    artifacts.write_artifact(tmp_path, "peps.rss", "<rss/>")
+    first = dict(artifacts._manifest)
+    (tmp_path / "peps.rss.gz").unlink()
+    artifacts.write_artifact(tmp_path, "peps.rss", "<rss/>")
+
+    assert artifacts._manifest == first
+    assert "peps.min.rss" not in first
+
+
+def test_recorded_since(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    artifacts.write_artifact(tmp_path, "peps.rss", "<rss/>")
+    artifacts.write_artifact(tmp_path, "topic/typing.rss", "<rss/>")
+    snapshot = artifacts.manifest_snapshot()
+
+    # Unchanged artifacts written again are included
+    artifacts.write_artifact(tmp_path, "peps.rss", "<rss/>")
+
+    assert artifacts.recorded_since(snapshot) == sorted(
+        ["peps.rss", *(f"peps.rss{suffix}" for suffix in artifacts.COMPRESSORS)]
+    )
+
+
+def test_replace_artifact_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    source = tmp_path / "peps.rss.tmp"
+    source.write_text("<rss/>", encoding="utf-8")
+    artifacts.replace_artifact(tmp_path, "peps.rss", source)
+    gzip_path = tmp_path / "peps.rss.gz"
+    mtimes = (tmp_path / "peps.rss").stat().st_mtime_ns, gzip_path.stat().st_mtime_ns
+    first = dict(artifacts._manifest)
+
+    source.write_text("<rss/>", encoding="utf-8")
+    artifacts.replace_artifact(tmp_path, "peps.rss", source)
+
+    assert not source.exists()
+    assert (
+        (tmp_path / "peps.rss").stat().st_mtime_ns,
+        gzip_path.stat().st_mtime_ns,
+    ) == mtimes
+    assert artifacts._manifest == first
+
+    source.write_text("<rss></rss>", encoding="utf-8")
+    artifacts.replace_artifact(tmp_path, "peps.rss", source)
+
+    assert gzip.decompress(gzip_path.read_bytes()) == b"<rss></rss>"
+
+
+def test_replace_artifact_digest(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    source = tmp_path / "peps.rss.tmp"
+    source.write_text("<rss/>", encoding="utf-8")
+    artifacts.replace_artifact(tmp_path, "peps.rss", source)
+    first = dict(artifacts._manifest)
+
+    # A known digest is trusted, and the source is not read
+    source.write_text("<xyz/>", encoding="utf-8")
+    artifacts.replace_artifact(
+        tmp_path, "peps.rss", source, first["peps.rss"]["sha256"]
+    )
+
+    assert not source.exists()
+    assert (tmp_path / "peps.rss").read_text(encoding="utf-8") == "<rss/>"
+    assert artifacts._manifest == first
+
+
+def test_write_manifest(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api" / "manifest.json").write_text(
+        json.dumps(
+            {
+                "kept.ics": {"sha256": "abc", "size": 1},
+                "removed.ics": {"sha256": "def", "size": 1},
+            }
+        ),
+        encoding="utf-8",
+    )
+    (tmp_path / "kept.ics").write_text("x", encoding="utf-8")
+
+    artifacts.write_artifact(tmp_path, "peps.rss", "<rss/>")
+    artifacts.write_manifest(tmp_path)
+
+    manifest = json.loads(
+        (tmp_path / "api" / "manifest.json").read_text(encoding="utf-8")
+    )
+    assert "kept.ics" in manifest
+    assert "removed.ics" not in manifest
+    assert manifest["peps.rss"]["size"] == 6
+
+
+def test_write_output_manifest(tmp_path):
+    (tmp_path / "pep-0008.html").write_text("PEP 8", encoding="utf-8")
+    (tmp_path / "pep-0020.html").write_text("PEP 20", encoding="utf-8")
+    (tmp_path / ".doctrees").mkdir()
+    (tmp_path / ".doctrees" / "pep-0008.doctree").write_bytes(b"doctree")
+
+    artifacts.write_output_manifest(tmp_path, exclude=tmp_path / ".doctrees")
+    manifest_path = tmp_path / artifacts.OUTPUT_MANIFEST_PATH
+    first = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    assert first["changed"] == ["pep-0008.html", "pep-0020.html"]
+    assert first["removed"] == []
+    assert list(first["files"]) == ["pep-0008.html", "pep-0020.html"]
+
+    (tmp_path / "pep-0008.html").write_text("PEP 8, updated", encoding="utf-8")
+    (tmp_path / "pep-0020.html").unlink()
+    (tmp_path / "pep-0257.html").write_text("PEP 257", encoding="utf-8")
+    artifacts.write_output_manifest(tmp_path, exclude=tmp_path / ".doctrees")
+    second = json.loads(manifest_path.read_text(encoding="utf-8"))
+
+    assert second["changed"] == ["pep-0008.html", "pep-0257.html"]
+    assert second["removed"] == ["pep-0020.html"]
+
+
+def test_precompress_output(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {"peps.rss": {}})
+    (tmp_path / "pep-0008.html").write_text("PEP 8", encoding="utf-8")
+    (tmp_path / "_static").mkdir()
+    (tmp_path / "_static" / "style.css").write_text("body {}", encoding="utf-8")
+    (tmp_path / "_static" / "logo.png").write_bytes(b"\x89PNG")
+    (tmp_path / "peps.rss").write_text("<rss/>", encoding="utf-8")
+    (tmp_path / ".doctrees").mkdir()
+    (tmp_path / ".doctrees" / "skipped.txt").write_text("doctree", encoding="utf-8")
+
+    count = artifacts.precompress_output(
+        tmp_path, exclude=tmp_path / ".doctrees", max_workers=2
+    )
+
+    assert count == 2
+    assert gzip.decompress((tmp_path / "pep-0008.html.gz").read_bytes()) == b"PEP 8"
+    assert (tmp_path / "_static" / "style.css.gz").is_file()
+    assert not (tmp_path / "_static" / "logo.png.gz").exists()
+    assert not (tmp_path / "peps.rss.gz").exists()  # already written by write_artifact
+    assert not (tmp_path / ".doctrees" / "skipped.txt.gz").exists()
+
+
+def test_precompress_output_removes_orphans(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    (tmp_path / "pep-0008.html").write_text("PEP 8", encoding="utf-8")
+    (tmp_path / "pep-0020.html").write_text("PEP 20", encoding="utf-8")
+    (tmp_path / "archive.tar.gz").write_bytes(b"not a variant")
+    artifacts.precompress_output(tmp_path)
+
+    (tmp_path / "pep-0020.html").unlink()
+    (tmp_path / "pep-0020.html.zst").write_bytes(b"stale")
+    artifacts.precompress_output(tmp_path)
+    artifacts.write_output_manifest(tmp_path)
+
+    assert not (tmp_path / "pep-0020.html.gz").exists()
+    assert not (tmp_path / "pep-0020.html.zst").exists()
+    assert (tmp_path / "pep-0008.html.gz").is_file()
+    assert (tmp_path / "archive.tar.gz").is_file()
+    manifest = json.loads(
+        (tmp_path / artifacts.OUTPUT_MANIFEST_PATH).read_text(encoding="utf-8")
+    )
+    assert not any(name.startswith("pep-0020") for name in manifest["files"])
+
+
+def test_precompress_output_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    (tmp_path / "pep-0008.html").write_text("PEP 8", encoding="utf-8")
+    (tmp_path / "pep-0020.html").write_text("PEP 20", encoding="utf-8")
+
+    assert artifacts.precompress_output(tmp_path) == 2
+    artifacts.write_output_manifest(tmp_path)
+    assert artifacts.precompress_output(tmp_path) == 0
+
+    (tmp_path / "pep-0008.html").write_text("PEP 8, updated", encoding="utf-8")
+    (tmp_path / "pep-0020.html.gz").unlink()
+
+    assert artifacts.precompress_output(tmp_path) == 2
+    assert (
+        gzip.decompress((tmp_path / "pep-0008.html.gz").read_bytes())
+        == b"PEP 8, updated"
+    )
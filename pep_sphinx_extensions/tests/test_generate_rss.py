@@ -0,0 +1,230 @@
+import json
+import os
+import pickle
+import xml.etree.ElementTree as ET
+
+import pytest
+from docutils import nodes
+from docutils.utils import new_document
+
+from pep_sphinx_extensions import artifacts, generate_rss, metadata_store
+from pep_sphinx_extensions.pep_processor.transforms import pep_footer
+from release_management import source_date
+
+
+@pytest.fixture(autouse=True)
+def _isolate_build_state(monkeypatch):
+    # Module-level caches and records otherwise leak between builds
+    monkeypatch.setattr(generate_rss, "document_cache", {})
+    monkeypatch.setattr(artifacts, "_manifest", {})
+    monkeypatch.setattr(metadata_store, "_stores", {})
+    source_date.cache_clear()
+    yield
+    metadata_store.close_metadata_stores()
+    source_date.cache_clear()
+
+
+def _write_doctree(doctree_dir, number, created, topic="", status="Draft"):
+    document = new_document(f"pep-{number:0>4}.rst")
+    document["headers"] = {
+        "PEP": str(number),
+        "Title": f"Title {number}",
+        "Author": "Author Name",
+        "Status": status,
+        "Topic": topic,
+        "Created": created,
+    }
+    document += nodes.section(
+        "", nodes.title("", "Abstract"), nodes.paragraph("", f"Abstract {number}.")
+    )
+    doctree_dir.joinpath(f"pep-{number:0>4}.doctree").write_bytes(
+        pickle.dumps(document)
+    )
+
+
+def test_create_rss_feed(tmp_path):
+    doctree_dir, output_dir = tmp_path / "doctrees", tmp_path / "html"
+    doctree_dir.mkdir()
+    _write_doctree(doctree_dir, 9001, "01-Jan-2020", topic="Typing")
+    _write_doctree(doctree_dir, 9002, "01-Jan-2021", topic="Packaging, Typing")
+    _write_doctree(doctree_dir, 9003, "01-Jan-2022")
+
+    generate_rss.create_rss_feed(doctree_dir, output_dir)
+
+    feed = output_dir.joinpath("peps.rss").read_text(encoding="utf-8")
+    assert feed.index("PEP 9003") < feed.index("PEP 9002") < feed.index("PEP 9001")
+    assert "<description>Abstract 9003.</description>" in feed
+
+    typing_feed = output_dir.joinpath("topic", "typing.rss").read_text(encoding="utf-8")
+    assert "PEP 9001" in typing_feed
+    assert "PEP 9002" in typing_feed
+    assert "PEP 9003" not in typing_feed
+    assert "https://peps.python.org/topic/typing.rss" in typing_feed
+    packaging_feed = output_dir.joinpath("topic", "packaging.rss").read_text(
+        encoding="utf-8"
+    )
+    assert packaging_feed.count("<item>") == 1
+    assert (
+        output_dir.joinpath("topic", "release.rss")
+        .read_text(encoding="utf-8")
+        .count("<item>")
+        == 0
+    )
+
+
+def test_create_rss_feed_status_changes(tmp_path):
+    doctree_dir, output_dir = tmp_path / "doctrees", tmp_path / "html"
+    doctree_dir.mkdir()
+    _write_doctree(doctree_dir, 9001, "01-Jan-2020", status="Accepted")
+    _write_doctree(doctree_dir, 9002, "01-Jan-2021")
+    output_dir.joinpath("api").mkdir(parents=True)
+    changes = [
+        {
+            "date": "2025-01-02T00:00:00+00:00",
+            "added": [],
+            "removed": [],
+            "changed": {
+                "9001": {"status": {"old": "Draft", "new": "Accepted"}},
+                "9002": {"title": {"old": "Old", "new": "Title 9002"}},
+            },
+        }
+    ]
+    output_dir.joinpath("api", "peps-changes.json").write_text(
+        json.dumps({"changes": changes}), encoding="utf-8"
+    )
+
+    generate_rss.create_rss_feed(doctree_dir, output_dir)
+
+    feed = output_dir.joinpath("peps-status.rss").read_text(encoding="utf-8")
+    assert feed.count("<item>") == 1
+    assert "<title>PEP 9001: Title 9001 (Draft → Accepted)</title>" in feed
+    assert (
+        '<guid isPermaLink="false">tag:peps.python.org,2025-01-02:pep-9001-accepted</guid>'
+        in feed
+    )
+    assert "<pubDate>Thu, 02 Jan 2025 00:00:00 GMT</pubDate>" in feed
+
+
+def test_create_rss_feed_modified(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        pep_footer,
+        "_LAST_MODIFIED_TIMES",
+        {
+            "pep-9001": "2025-03-04 05:06:07",
+            "pep-9002": "2024-01-01 00:00:00",
+            "pep-9003": "",
+        },
+    )
+    doctree_dir, output_dir = tmp_path / "doctrees", tmp_path / "html"
+    doctree_dir.mkdir()
+    for number in 9001, 9002, 9003:
+        _write_doctree(doctree_dir, number, "01-Jan-2020")
+
+    generate_rss.create_rss_feed(doctree_dir, output_dir)
+
+    rss = ET.parse(output_dir / "peps-updated.rss").getroot()
+    items = rss.findall("channel/item")
+    assert [item.findtext("title") for item in items] == [
+        "PEP 9001: Title 9001",
+        "PEP 9002: Title 9002",
+    ]
+    assert items[0].findtext("pubDate") == "Tue, 04 Mar 2025 05:06:07 GMT"
+    assert items[0].findtext("guid") == "tag:peps.python.org,2025-03-04:pep-9001-050607"
+
+
+def test_create_rss_feed_formats(tmp_path):
+    doctree_dir, output_dir = tmp_path / "doctrees", tmp_path / "html"
+    doctree_dir.mkdir()
+    _write_doctree(doctree_dir, 9001, "01-Jan-2020")
+    _write_doctree(doctree_dir, 9002, "01-Jan-2021")
+
+    generate_rss.create_rss_feed(doctree_dir, output_dir)
+
+    rss = ET.parse(output_dir / "peps.rss").getroot()
+    assert [title.text for title in rss.iterfind("channel/item/title")] == [
+        "PEP 9002: Title 9002",
+        "PEP 9001: Title 9001",
+    ]
+
+    atom = ET.parse(output_dir / "peps.atom").getroot()
+    ns = {"atom": "http://www.w3.org/2005/Atom"}
+    assert atom.findtext("atom:updated", namespaces=ns) == "2021-01-01T00:00:00Z"
+    assert [
+        entry.findtext("atom:id", namespaces=ns)
+        for entry in atom.iterfind("atom:entry", ns)
+    ] == [
+        "https://peps.python.org/pep-9002/",
+        "https://peps.python.org/pep-9001/",
+    ]
+
+    json_feed = json.loads(
+        output_dir.joinpath("peps.feed.json").read_text(encoding="utf-8")
+    )
+    assert json_feed["version"] == "https://jsonfeed.org/version/1.1"
+    assert json_feed["items"][0] == {
+        "id": "https://peps.python.org/pep-9002/",
+        "url": "https://peps.python.org/pep-9002/",
+        "title": "PEP 9002: Title 9002",
+        "summary": "Abstract 9002.",
+        "date_published": "2021-01-01T00:00:00Z",
+        "authors": [{"name": "Author Name"}],
+    }
+    assert (
+        json.loads(
+            output_dir.joinpath("peps-status.feed.json").read_text(encoding="utf-8")
+        )["items"]
+        == []
+    )
+    assert not list(output_dir.rglob("*.tmp"))
+
+
+def test_create_rss_feed_unchanged_items(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    doctree_dir, output_dir = tmp_path / "doctrees", tmp_path / "html"
+    doctree_dir.mkdir()
+    _write_doctree(doctree_dir, 9001, "01-Jan-2020")
+    generate_rss.create_rss_feed(doctree_dir, output_dir)
+    feed_path = output_dir / "peps.rss"
+    os.utime(feed_path, ns=(0, 0))
+
+    # The same items and build date give the same feed, which is not rewritten
+    generate_rss.create_rss_feed(doctree_dir, output_dir)
+    assert feed_path.stat().st_mtime_ns == 0
+    assert not list(output_dir.rglob("*.tmp"))
+
+    monkeypatch.setattr(generate_rss, "document_cache", {})
+    _write_doctree(doctree_dir, 9002, "01-Jan-2021")
+    generate_rss.create_rss_feed(doctree_dir, output_dir)
+    assert feed_path.stat().st_mtime_ns != 0
+    assert "pep-9002" in feed_path.read_text(encoding="utf-8")
+
+
+def test_get_from_doctree_metadata_store(tmp_path):
+    metadata = {
+        "pep-9001": {
+            "PEP": "9001",
+            "Title": "Stored title",
+            "Abstract": "Stored abstract.",
+        }
+    }
+    metadata_store.write_metadata_store(tmp_path / metadata_store.STORE_NAME, metadata)
+
+    # Read from the store, without unpickling the doctree
+    assert (
+        generate_rss.get_from_doctree(tmp_path / "pep-9001.doctree", "Title")
+        == "Stored title"
+    )
+    assert generate_rss.get_from_doctree(tmp_path / "pep-9001.doctree", "Status") == ""
+    assert generate_rss.document_cache == {}
+
+
+def test_create_rss_feed_source_date(tmp_path, monkeypatch):
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    doctree_dir, output_dir = tmp_path / "doctrees", tmp_path / "html"
+    doctree_dir.mkdir()
+    _write_doctree(doctree_dir, 9001, "01-Jan-2020")
+
+    generate_rss.create_rss_feed(doctree_dir, output_dir)
+
+    rss = ET.parse(output_dir / "peps.rss").getroot()
+    assert rss.findtext("channel/lastBuildDate") == "Tue, 14 Nov 2023 22:13:20 GMT"
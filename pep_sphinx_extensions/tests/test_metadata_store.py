@@ -0,0 +1,68 @@
+import pytest
+
+from pep_sphinx_extensions import metadata_store
+
+METADATA = {
+    "pep-0008": {
+        "PEP": "8",
+        "Title": "Style Guide for Python Code",
+        "Abstract": "Conventions…",
+    },
+    "pep-0020": {"PEP": "20", "Title": "The Zen of Python", "Abstract": ""},
+}
+
+
+@pytest.fixture(autouse=True)
+def _close_stores():
+    yield
+    metadata_store.close_metadata_stores()
+
+
+def test_metadata_store(tmp_path):
+    path = tmp_path / metadata_store.STORE_NAME
+    assert metadata_store.write_metadata_store(path, METADATA)
+
+    store = metadata_store.MetadataStore(path)
+    assert dict(store) == METADATA
+    assert "pep-0001" not in store
+    assert len(store) == 2
+    store.close()
+
+
+def test_write_metadata_store_unchanged(tmp_path):
+    path = tmp_path / metadata_store.STORE_NAME
+    metadata_store.write_metadata_store(path, METADATA)
+
+    assert not metadata_store.write_metadata_store(
+        path, dict(reversed(METADATA.items()))
+    )
+    assert metadata_store.write_metadata_store(path, {"pep-0008": METADATA["pep-0008"]})
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_open_metadata_store(tmp_path):
+    assert metadata_store.open_metadata_store(tmp_path) is None
+
+    metadata_store.write_metadata_store(tmp_path / metadata_store.STORE_NAME, METADATA)
+    store = metadata_store.open_metadata_store(tmp_path)
+    assert store["pep-0020"]["Title"] == "The Zen of Python"
+    assert metadata_store.open_metadata_store(tmp_path) is store
+
+    # A store replaced by a later build is reopened
+    metadata_store.write_metadata_store(
+        tmp_path / metadata_store.STORE_NAME, {"pep-0008": METADATA["pep-0008"]}
+    )
+    reopened = metadata_store.open_metadata_store(tmp_path)
+    assert reopened is not store
+    assert list(reopened) == ["pep-0008"]
+
+
+def test_close_metadata_stores(tmp_path):
+    metadata_store.write_metadata_store(tmp_path / metadata_store.STORE_NAME, METADATA)
+    store = metadata_store.open_metadata_store(tmp_path)
+
+    metadata_store.close_metadata_stores()
+
+    assert metadata_store._stores == {}
+    assert store._map.closed
+    assert metadata_store.open_metadata_store(tmp_path) is not store
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import datetime as dt
+import functools
+import hashlib
+import os
+import pickle
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 try:
     import tomllib
@@ -11,7 +19,7 @@ except ImportError:
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    import datetime as dt
+    from collections.abc import Iterable, Mapping, Sequence
     from typing import Literal, TypeAlias
 
     ReleaseState: TypeAlias = Literal['actual', 'expected']
@@ -23,14 +31,33 @@ if TYPE_CHECKING:
 RELEASE_DIR = Path(__file__).resolve().parent
 ROOT_DIR = RELEASE_DIR.parent
 PEP_ROOT = ROOT_DIR / 'peps'
+RELEASES_TOML = RELEASE_DIR / 'python-releases.toml'
+# Parsed releases are cached with other build output, keyed by content hash
+RELEASES_CACHE_DIR = ROOT_DIR / 'build' / 'release-cache'
 
 dc_kw = {'kw_only': True, 'slots': True} if sys.version_info[:2] >= (3, 10) else {}
 
 
 @dataclass(frozen=True, **dc_kw)
 class PythonReleases:
-    metadata: dict[str, VersionMetadata]
-    releases: dict[str, list[ReleaseInfo]]
+    """Metadata and releases of every version.
+
+    Loaded releases are shared between callers, so are read-only mappings.
+    """
+
+    metadata: Mapping[str, VersionMetadata]
+    releases: Mapping[str, Sequence[ReleaseInfo]]
+
+    @classmethod
+    def read_only(
+        cls,
+        metadata: dict[str, VersionMetadata],
+        releases: dict[str, tuple[ReleaseInfo, ...]],
+    ) -> PythonReleases:
+        """Wrap the metadata and releases of every version as read-only mappings."""
+        return cls(
+            metadata=MappingProxyType(metadata), releases=MappingProxyType(releases)
+        )
 
 
 @dataclass(frozen=True, **dc_kw)
@@ -67,15 +94,128 @@ class ReleaseInfo:
         return f'- {self.stage}: {self.date:%A, %Y-%m-%d}'
 
 
+@functools.cache
+def source_date() -> dt.datetime:
+    """Return the time to stamp generated files with, in UTC.
+
+    This is ``SOURCE_DATE_EPOCH`` if set and not empty, and otherwise the time
+    of the HEAD commit, so that building the same commit twice gives
+    identical output. Outside of a git checkout, this is the current time.
+    See https://reproducible-builds.org/specs/source-date-epoch/.
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH') or None
+    if epoch is not None:
+        try:
+            return dt.datetime.fromtimestamp(int(epoch), dt.timezone.utc)
+        except (ValueError, OverflowError, OSError):
+            msg = f'SOURCE_DATE_EPOCH must be an integer timestamp, not {epoch!r}'
+            raise ValueError(msg) from None
+
+    try:
+        ret = subprocess.run(
+            ('git', 'log', '-1', '--format=%ct'),
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:  # git is not installed
+        pass
+    else:
+        if ret.returncode == 0 and (head_time := ret.stdout.strip()):
+            return dt.datetime.fromtimestamp(int(head_time), dt.timezone.utc)
+    return dt.datetime.now(dt.timezone.utc).replace(microsecond=0)
+
+
+# The last releases loaded in this process, with their content hash
+_loaded: tuple[str, PythonReleases] | None = None
+
+
 def load_python_releases() -> PythonReleases:
-    with open(RELEASE_DIR / 'python-releases.toml', 'rb') as f:
-        python_releases = tomllib.load(f)
+    """Load the release data from ``python-releases.toml``.
+
+    The result is shared between callers, and is read-only.
+    It is memoised for as long as the file's contents are unchanged,
+    and parsed data is cached on disk by content hash,
+    so that other processes can skip parsing the TOML.
+    """
+    global _loaded
+
+    toml_bytes = RELEASES_TOML.read_bytes()
+    # The loader is hashed too, as the cache holds instances of its classes
+    digest = hashlib.sha256(toml_bytes)
+    digest.update(Path(__file__).read_bytes())
+    key = digest.hexdigest()
+    if _loaded is not None and _loaded[0] == key:
+        return _loaded[1]
+
+    cache_path = RELEASES_CACHE_DIR / (
+        f'python-releases.{sys.implementation.cache_tag}.{key[:16]}.pickle'
+    )
+    try:
+        metadata, releases = pickle.loads(cache_path.read_bytes())
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+        metadata, releases = _parse_python_releases(toml_bytes)
+        _write_releases_cache(cache_path, (metadata, releases))
+
+    python_releases = PythonReleases.read_only(metadata, releases)
+    _loaded = key, python_releases
+    return python_releases
+
+
+def _parse_python_releases(
+    toml_bytes: bytes,
+) -> tuple[dict[str, VersionMetadata], dict[str, tuple[ReleaseInfo, ...]]]:
+    python_releases = tomllib.loads(toml_bytes.decode('utf-8'))
     all_metadata = {
         v: VersionMetadata.from_toml(metadata)
         for v, metadata in python_releases['metadata'].items()
     }
     all_releases = {
-        v: [ReleaseInfo(**r) for r in releases]
+        v: tuple(ReleaseInfo(**r) for r in releases)
         for v, releases in python_releases['release'].items()
     }
-    return PythonReleases(metadata=all_metadata, releases=all_releases)
+    return all_metadata, all_releases
+
+
+def _write_releases_cache(cache_path: Path, parsed: tuple[dict, dict]) -> None:
+    try:
+        write_if_changed(cache_path, pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL))
+    except (OSError, pickle.PicklingError, TypeError):
+        # The cache is an optimisation only, e.g. for read-only checkouts
+        return
+    cache_tag = sys.implementation.cache_tag
+    for stale_path in cache_path.parent.glob(f'python-releases.{cache_tag}.*.pickle'):
+        if stale_path != cache_path:
+            stale_path.unlink(missing_ok=True)
+
+
+def write_if_changed(path: Path, contents: bytes) -> bool:
+    """Write contents to path, unless the file already holds them.
+
+    Missing parent directories are created.
+    The file is replaced atomically, as other processes may be reading it.
+    Returns whether the file was written.
+    """
+    try:
+        if path.stat().st_size == len(contents) and path.read_bytes() == contents:
+            return False
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    try:
+        temp_path.write_bytes(contents)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def write_artifacts(
+    artifacts: Iterable[tuple[Path, bytes]], *, max_workers: int | None = None
+) -> list[Path]:
+    """Write the artifacts in a thread pool, returning the paths that changed."""
+    artifacts = list(artifacts)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        written = pool.map(lambda artifact: write_if_changed(*artifact), artifacts)
+        return [path for (path, _), changed in zip(artifacts, written) if changed]
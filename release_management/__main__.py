@@ -1,42 +1,91 @@
 from __future__ import annotations
 
 import argparse
+import datetime as dt
 
 commands = (
     CMD_FULL_JSON := 'full-json',
     CMD_UPDATE_PEPS := 'update-peps',
     CMD_RELEASE_CYCLE := 'release-cycle',
     CMD_CALENDAR := 'calendar',
+    CMD_ALL := 'all',
+    CMD_VERSIONS := 'versions',
+    CMD_NEXT_RELEASE := 'next-release',
 )
 parser = argparse.ArgumentParser(allow_abbrev=False)
 parser.add_argument('COMMAND', choices=commands)
+parser.add_argument(
+    '--check',
+    action='store_true',
+    help=f'with {CMD_UPDATE_PEPS!r}, only report PEPs that are out of date',
+)
+parser.add_argument(
+    '--date',
+    type=dt.date.fromisoformat,
+    default=dt.date.today(),
+    help=f'with {CMD_VERSIONS!r} or {CMD_NEXT_RELEASE!r}, the date to query',
+)
+parser.add_argument(
+    '--phase',
+    choices=('feature', 'prerelease', 'bugfix', 'security', 'end-of-life'),
+    help=f'with {CMD_VERSIONS!r}, only list versions in this phase',
+)
+parser.add_argument(
+    '--version',
+    help=f'with {CMD_NEXT_RELEASE!r}, only find releases of this version',
+)
 
 args = parser.parse_args()
 if args.COMMAND == CMD_UPDATE_PEPS:
     from release_management.update_release_schedules import update_peps
 
-    raise SystemExit(update_peps())
+    raise SystemExit(update_peps(check=args.check))
 
 if args.COMMAND == CMD_FULL_JSON:
-    from release_management import ROOT_DIR
-    from release_management.serialize import create_release_json
+    from release_management import write_if_changed
+    from release_management.serialize import OUTPUT_DIR, create_release_json
 
-    json_path = ROOT_DIR / 'python-releases.json'
-    json_path.write_text(create_release_json(), encoding='utf-8')
+    json_path = OUTPUT_DIR / 'python-releases.json'
+    write_if_changed(json_path, create_release_json().encode('utf-8'))
     raise SystemExit(0)
 
 if args.COMMAND == CMD_RELEASE_CYCLE:
-    from release_management import ROOT_DIR
-    from release_management.serialize import create_release_cycle
+    from release_management import write_if_changed
+    from release_management.serialize import OUTPUT_DIR, create_release_cycle
 
-    json_path = ROOT_DIR / 'release-cycle.json'
-    json_path.write_text(create_release_cycle(), encoding='utf-8')
+    json_path = OUTPUT_DIR / 'release-cycle.json'
+    write_if_changed(json_path, create_release_cycle().encode('utf-8'))
     raise SystemExit(0)
 
 if args.COMMAND == CMD_CALENDAR:
-    from release_management import ROOT_DIR
-    from release_management.serialize import create_release_schedule_calendar
+    from release_management.serialize import OUTPUT_DIR, write_release_calendars
+
+    write_release_calendars(OUTPUT_DIR)
+    raise SystemExit(0)
+
+if args.COMMAND == CMD_ALL:
+    from release_management.pipeline import build_all
+
+    raise SystemExit(build_all())
+
+if args.COMMAND == CMD_VERSIONS:
+    from release_management.index import load_release_index
+
+    index = load_release_index()
+    if args.phase:
+        for version in index.versions(args.date, args.phase):
+            print(version)
+    else:
+        for version, phase in index.phases(args.date).items():
+            print(f'{version}: {phase}')
+    raise SystemExit(0)
+
+if args.COMMAND == CMD_NEXT_RELEASE:
+    from release_management.index import load_release_index
 
-    calendar_path = ROOT_DIR / 'release-schedule.ics'
-    calendar_path.write_text(create_release_schedule_calendar(), encoding='utf-8')
+    next_release = load_release_index().next_release(args.date, args.version)
+    if next_release is None:
+        raise SystemExit('No scheduled release found')
+    _version, release = next_release
+    print(f'{release.stage}: {release.date.isoformat()} ({release.state})')
     raise SystemExit(0)
@@ -0,0 +1,165 @@
+"""Date-based queries over the release data.
+
+The index is built once per load of ``python-releases.toml``, so that each
+query is a binary search rather than a scan of every version and release.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python -m release_management versions --phase security --date 2026-01-01
+    $ python -m release_management next-release --version 3.14
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime as dt
+
+from release_management import load_python_releases
+from release_management.serialize import version_to_tuple
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from release_management import (
+        PythonReleases,
+        ReleaseInfo,
+        VersionMetadata,
+        VersionStatus,
+    )
+
+PHASES: tuple[VersionStatus, ...] = (
+    'feature',
+    'prerelease',
+    'bugfix',
+    'security',
+    'end-of-life',
+)
+ONE_DAY = dt.timedelta(days=1)
+
+
+def lifecycle(metadata: VersionMetadata, /) -> list[tuple[dt.date, VersionStatus]]:
+    """Return the start date of each phase in the lifecycle of a version.
+
+    Each phase lasts until the next one starts. Phases which would end
+    before they start, such as a security phase which ends on the last
+    bugfix release, are omitted.
+    """
+    starts = (
+        metadata.start_of_development,
+        metadata.feature_freeze,
+        metadata.first_release,
+        metadata.end_of_bugfix + ONE_DAY,
+        metadata.end_of_life,
+    )
+    intervals = []
+    next_start = dt.date.max
+    for start, phase in reversed(tuple(zip(starts, PHASES))):
+        if start < next_start or phase == 'end-of-life':
+            intervals.append((start, phase))
+            next_start = start
+    intervals.reverse()
+    return intervals
+
+
+class ReleaseIndex:
+    """Releases and version lifecycles, indexed by date."""
+
+    def __init__(self, python_releases: PythonReleases, /) -> None:
+        self.python_releases = python_releases
+        versions = sorted(python_releases.metadata, key=version_to_tuple)
+
+        # Each version's lifecycle, as parallel lists for bisection
+        self._lifecycles: dict[str, tuple[list[dt.date], list[VersionStatus]]] = {}
+        for version in versions:
+            starts, phases = zip(*lifecycle(python_releases.metadata[version]))
+            self._lifecycles[version] = list(starts), list(phases)
+
+        # The phase of every version between each change of any version's phase
+        self._change_dates = sorted({
+            start for starts, _ in self._lifecycles.values() for start in starts
+        })
+        self._snapshots: list[dict[VersionStatus, tuple[str, ...]]] = []
+        for date in self._change_dates:
+            snapshot: dict[VersionStatus, list[str]] = {phase: [] for phase in PHASES}
+            for version in versions:
+                if (phase := self.phase(version, date)) is not None:
+                    snapshot[phase].append(version)
+            self._snapshots.append({p: tuple(v) for p, v in snapshot.items()})
+
+        # All releases, and each version's releases, sorted by date
+        self._releases = sorted(
+            (
+                (version, release)
+                for version, releases in python_releases.releases.items()
+                for release in releases
+            ),
+            key=lambda item: (item[1].date, version_to_tuple(item[0])),
+        )
+        self._release_dates = [release.date for _, release in self._releases]
+        self._version_releases: dict[str, tuple[list[dt.date], list[ReleaseInfo]]] = {}
+        for version, release in self._releases:
+            dates, releases = self._version_releases.setdefault(version, ([], []))
+            dates.append(release.date)
+            releases.append(release)
+
+    def phase(self, version: str, date: dt.date) -> VersionStatus | None:
+        """Return the phase of a version on a date.
+
+        Returns ``None`` before development of the version began.
+        """
+        starts, phases = self._lifecycles[version]
+        i = bisect.bisect_right(starts, date)
+        return phases[i - 1] if i else None
+
+    def versions(self, date: dt.date, phase: VersionStatus) -> tuple[str, ...]:
+        """Return the versions in a phase on a date, oldest first."""
+        i = bisect.bisect_right(self._change_dates, date)
+        return self._snapshots[i - 1][phase] if i else ()
+
+    def phases(self, date: dt.date) -> dict[str, VersionStatus]:
+        """Return the phase of each version developed by a date, oldest first."""
+        i = bisect.bisect_right(self._change_dates, date)
+        if not i:
+            return {}
+        phases = {
+            version: phase
+            for phase, versions in self._snapshots[i - 1].items()
+            for version in versions
+        }
+        return dict(sorted(phases.items(), key=lambda item: version_to_tuple(item[0])))
+
+    def next_release(
+        self, date: dt.date, version: str | None = None
+    ) -> tuple[str, ReleaseInfo] | None:
+        """Return the first release on or after a date, optionally of one version."""
+        if version is None:
+            i = bisect.bisect_left(self._release_dates, date)
+            if i == len(self._releases):
+                return None
+            return self._releases[i]
+        dates, releases = self._version_releases.get(version, ((), ()))
+        i = bisect.bisect_left(dates, date)
+        return (version, releases[i]) if i < len(releases) else None
+
+    def releases_between(
+        self, start: dt.date, end: dt.date
+    ) -> list[tuple[str, ReleaseInfo]]:
+        """Return the releases from start to end inclusive, in date order."""
+        lo = bisect.bisect_left(self._release_dates, start)
+        hi = bisect.bisect_right(self._release_dates, end)
+        return self._releases[lo:hi]
+
+
+# The index of the releases last loaded in this process
+_index: ReleaseIndex | None = None
+
+
+def load_release_index() -> ReleaseIndex:
+    """Return the index of the current release data, building it if needed."""
+    global _index
+
+    python_releases = load_python_releases()
+    if _index is None or _index.python_releases is not python_releases:
+        _index = ReleaseIndex(python_releases)
+    return _index
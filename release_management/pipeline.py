@@ -0,0 +1,48 @@
+"""Build every release artifact from a single load of the release data.
+
+Usage:
+
+.. code-block:: shell
+
+    $ python -m release_management all
+
+The JSON files and calendars are written to ``build/releases``,
+and the release schedule PEPs are regenerated in place.
+Artifacts are only written if their contents changed.
+"""
+
+from __future__ import annotations
+
+from release_management import ROOT_DIR, load_python_releases, write_artifacts
+from release_management.serialize import (
+    OUTPUT_DIR,
+    create_release_cycle,
+    create_release_json,
+    write_release_calendars,
+)
+from release_management.update_release_schedules import create_pep_sources
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+def create_artifacts() -> Iterator[tuple[Path, bytes]]:
+    """Yield the path and contents of each release artifact."""
+    # Loaded once here, as every generator below shares the memoised data
+    load_python_releases()
+    yield OUTPUT_DIR / 'python-releases.json', create_release_json().encode('utf-8')
+    yield OUTPUT_DIR / 'release-cycle.json', create_release_cycle().encode('utf-8')
+    yield from create_pep_sources()
+
+
+def build_all() -> int:
+    artifacts = list(create_artifacts())
+    changed = write_artifacts(artifacts)
+    # Calendars are streamed to disk, rather than held in memory
+    changed += write_release_calendars(OUTPUT_DIR)
+    for path in changed:
+        print(f'Updated {path.relative_to(ROOT_DIR)}')
+    print(f'{len(changed)} artifacts changed')
+    return 0
@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import datetime as dt
 import dataclasses
+import filecmp
 import json
+import os
+from pathlib import Path
 
-from release_management import ROOT_DIR, load_python_releases
+from release_management import ROOT_DIR, load_python_releases, source_date
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import BinaryIO
+
     from release_management import ReleaseInfo, VersionMetadata
 
 # Seven years captures the full lifecycle from prereleases to end-of-life
-TODAY = dt.date.today()
+TODAY = source_date().date()
 SEVEN_YEARS_AGO = TODAY.replace(year=TODAY.year - 7)
 
 # https://datatracker.ietf.org/doc/html/rfc5545#section-3.3.11
@@ -21,10 +27,25 @@ CALENDAR_ESCAPE_TEXT = str.maketrans({
     ',': r'\,',
     '\n': r'\n',
 })
+# Maximum length of a calendar content line in octets, excluding the line break
+CALENDAR_LINE_LENGTH = 75
+# Where the command-line interface writes the JSON files and calendars.
+# Sphinx builds write them to the output directory instead.
+OUTPUT_DIR = ROOT_DIR / 'build' / 'releases'
 
 
 def create_release_json() -> str:
-    python_releases = dataclasses.asdict(load_python_releases())
+    releases = load_python_releases()
+    python_releases = {
+        'metadata': {
+            version: dataclasses.asdict(metadata)
+            for version, metadata in releases.metadata.items()
+        },
+        'releases': {
+            version: [dataclasses.asdict(release) for release in version_releases]
+            for version, version_releases in releases.releases.items()
+        },
+    }
     return json.dumps(
         python_releases,
         indent=2,
@@ -63,7 +84,12 @@ def version_info(metadata: VersionMetadata, /) -> dict[str, str | int]:
     }
 
 
-def create_release_schedule_calendar() -> str:
+def release_calendars() -> Iterator[tuple[str, str, list[tuple[int, ReleaseInfo]]]]:
+    """Yield the file name, title, and releases of each calendar.
+
+    This is the combined calendar of all versions, then a calendar for each
+    version, with releases in date order.
+    """
     python_releases = load_python_releases()
     releases = []
     for version, all_releases in python_releases.releases.items():
@@ -72,44 +98,126 @@ def create_release_schedule_calendar() -> str:
             # Keep size reasonable by omitting releases older than 7 years
             if release.date < SEVEN_YEARS_AGO:
                 continue
-            releases.append((pep_number, release))
-    releases.sort(key=lambda r: r[1].date)
-    lines = release_schedule_calendar_lines(releases)
-    return '\r\n'.join(lines)
+            releases.append((version, pep_number, release))
+    releases.sort(key=lambda r: r[2].date)
+
+    yield (
+        'release-schedule.ics',
+        'Python releases schedule',
+        [(pep_number, release) for _version, pep_number, release in releases],
+    )
+    by_version: dict[str, list[tuple[int, ReleaseInfo]]] = {}
+    for version, pep_number, release in releases:
+        by_version.setdefault(version, []).append((pep_number, release))
+    for version in sorted(by_version, key=version_to_tuple):
+        yield (
+            f'release-schedule-{version}.ics',
+            f'Python {version} release schedule',
+            by_version[version],
+        )
 
 
 def release_schedule_calendar_lines(
-    releases: list[tuple[int, ReleaseInfo]], /
-) -> list[str]:
-    dtstamp = dt.datetime.now(dt.timezone.utc).strftime('%Y%m%dT%H%M%SZ')
-
-    lines = [
+    releases: list[tuple[int, ReleaseInfo]],
+    /,
+    *,
+    title: str = 'Python releases schedule',
+    dtstamp: dt.datetime | None = None,
+) -> Iterator[str]:
+    """Yield the content lines of a calendar of releases, before folding."""
+    if dtstamp is None:
+        dtstamp = source_date()
+    dtstamp_text = dtstamp.strftime('%Y%m%dT%H%M%SZ')
+
+    yield from (
         'BEGIN:VCALENDAR',
         'VERSION:2.0',
         'PRODID:-//Python Software Foundation//Python release schedule//EN',
-        'X-WR-CALDESC:Python releases schedule from https://peps.python.org',
-        'X-WR-CALNAME:Python releases schedule',
-    ]
+        f'X-WR-CALDESC:{title} from https://peps.python.org',
+        f'X-WR-CALNAME:{title}',
+    )
     for pep_number, release in releases:
         normalised_stage = release.stage.replace(' ', '')
         normalised_stage = normalised_stage.translate(CALENDAR_ESCAPE_TEXT)
-        if release.note:
-            normalised_note = release.note.translate(CALENDAR_ESCAPE_TEXT)
-            note = (f'DESCRIPTION:Note: {normalised_note}',)
-        else:
-            note = ()
-        lines += (
+        yield from (
             'BEGIN:VEVENT',
-            f'DTSTAMP:{dtstamp}',
+            f'DTSTAMP:{dtstamp_text}',
             f'UID:python-{normalised_stage}@releases.python.org',
             f'DTSTART;VALUE=DATE:{release.date.strftime("%Y%m%d")}',
             f'SUMMARY:Python {release.stage}',
-            *note,
+        )
+        if release.note:
+            normalised_note = release.note.translate(CALENDAR_ESCAPE_TEXT)
+            yield f'DESCRIPTION:Note: {normalised_note}'
+        yield from (
             f'URL:https://peps.python.org/pep-{pep_number:04d}/',
             'END:VEVENT',
         )
-    lines += (
-        'END:VCALENDAR',
-        '',
-    )
-    return lines
+    yield 'END:VCALENDAR'
+
+
+def fold_calendar_line(line: str, /) -> bytes:
+    """Encode a content line, folded to at most 75 octets per line.
+
+    See https://datatracker.ietf.org/doc/html/rfc5545#section-3.1.
+    Continuation lines start with a space, and multi-octet characters
+    are never split.
+    """
+    encoded = line.encode('utf-8')
+    if len(encoded) <= CALENDAR_LINE_LENGTH:
+        return encoded + b'\r\n'
+    parts = []
+    start = 0
+    limit = CALENDAR_LINE_LENGTH
+    while len(encoded) - start > limit:
+        end = start + limit
+        # Back up to the first octet of a UTF-8 sequence
+        while encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end])
+        start = end
+        limit = CALENDAR_LINE_LENGTH - 1  # allow for the leading space
+    parts.append(encoded[start:])
+    return b'\r\n '.join(parts) + b'\r\n'
+
+
+def write_calendar(file: BinaryIO, lines: Iterable[str], /) -> None:
+    """Stream the content lines of a calendar to a binary file."""
+    file.writelines(map(fold_calendar_line, lines))
+
+
+def write_release_calendars(
+    output_dir: Path, *, dtstamp: dt.datetime | None = None
+) -> list[Path]:
+    """Write the combined and per-version calendars, returning those that changed.
+
+    Calendars whose contents are unchanged are not rewritten, and calendars of
+    versions no longer in the release data are removed.
+    The ``DTSTAMP`` defaults to ``source_date()``, so that rebuilding the same
+    commit gives identical calendars.
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    changed = []
+    names = set()
+    for name, title, releases in release_calendars():
+        names.add(name)
+        path = Path(output_dir, name)
+        temp_path = path.with_name(f'{path.name}.tmp')
+        with open(temp_path, 'wb') as f:
+            lines = release_schedule_calendar_lines(
+                releases, title=title, dtstamp=dtstamp
+            )
+            write_calendar(f, lines)
+        try:
+            unchanged = filecmp.cmp(path, temp_path, shallow=False)
+        except FileNotFoundError:
+            unchanged = False
+        if unchanged:
+            temp_path.unlink()
+        else:
+            os.replace(temp_path, path)
+            changed.append(path)
+    for stale_path in Path(output_dir).glob('release-schedule-*.ics'):
+        if stale_path.name not in names:
+            stale_path.unlink()
+    return changed
@@ -0,0 +1,113 @@
+import datetime as dt
+
+from release_management import PythonReleases, ReleaseInfo, VersionMetadata
+from release_management.index import ReleaseIndex, lifecycle
+
+
+def _metadata(pep, start, freeze, first, bugfix, eol):
+    return VersionMetadata(
+        pep=pep,
+        status='bugfix',
+        branch='main',
+        release_manager='Release Manager',
+        start_of_development=dt.date(*start),
+        feature_freeze=dt.date(*freeze),
+        first_release=dt.date(*first),
+        end_of_bugfix=dt.date(*bugfix),
+        end_of_life=dt.date(*eol),
+    )
+
+
+def _release(stage, *date, state='actual'):
+    return ReleaseInfo(stage=stage, state=state, date=dt.date(*date))
+
+
+INDEX = ReleaseIndex(
+    PythonReleases(
+        metadata={
+            '3.98': _metadata(
+                9998,
+                (2097, 5, 1),
+                (2098, 5, 1),
+                (2098, 10, 1),
+                (2100, 10, 1),
+                (2103, 10, 1),
+            ),
+            '3.99': _metadata(
+                9999,
+                (2098, 5, 1),
+                (2099, 5, 1),
+                (2099, 10, 1),
+                (2101, 10, 1),
+                (2101, 10, 1),
+            ),
+        },
+        releases={
+            '3.98': [
+                _release('3.98.0 final', 2098, 10, 1),
+                _release('3.98.1', 2098, 12, 1),
+                _release('3.98.2', 2099, 10, 1, state='expected'),
+            ],
+            '3.99': [
+                _release('3.99.0 beta 1', 2099, 5, 1),
+                _release('3.99.0 final', 2099, 10, 1, state='expected'),
+            ],
+        },
+    )
+)
+
+
+def test_lifecycle() -> None:
+    metadata = _metadata(
+        9999, (2098, 5, 1), (2099, 5, 1), (2099, 10, 1), (2101, 10, 1), (2101, 10, 1)
+    )
+
+    # The security phase is omitted, as bugfixes end with the version's life
+    assert lifecycle(metadata) == [
+        (dt.date(2098, 5, 1), 'feature'),
+        (dt.date(2099, 5, 1), 'prerelease'),
+        (dt.date(2099, 10, 1), 'bugfix'),
+        (dt.date(2101, 10, 1), 'end-of-life'),
+    ]
+
+
+def test_phase() -> None:
+    assert INDEX.phase('3.98', dt.date(2097, 4, 30)) is None
+    assert INDEX.phase('3.98', dt.date(2100, 10, 1)) == 'bugfix'
+    assert INDEX.phase('3.98', dt.date(2100, 10, 2)) == 'security'
+    assert INDEX.phase('3.98', dt.date(2103, 10, 1)) == 'end-of-life'
+
+
+def test_versions() -> None:
+    assert INDEX.versions(dt.date(2000, 1, 1), 'feature') == ()
+    assert INDEX.versions(dt.date(2098, 6, 1), 'feature') == ('3.99',)
+    assert INDEX.versions(dt.date(2098, 6, 1), 'prerelease') == ('3.98',)
+    assert INDEX.versions(dt.date(2100, 1, 1), 'bugfix') == ('3.98', '3.99')
+    assert INDEX.versions(dt.date(2102, 1, 1), 'security') == ('3.98',)
+    assert INDEX.phases(dt.date(2102, 1, 1)) == {
+        '3.98': 'security',
+        '3.99': 'end-of-life',
+    }
+
+
+def test_next_release() -> None:
+    assert INDEX.next_release(dt.date(2098, 12, 2)) == (
+        '3.99',
+        _release('3.99.0 beta 1', 2099, 5, 1),
+    )
+    # Releases on the same day are ordered by version
+    assert INDEX.next_release(dt.date(2099, 6, 1))[1].stage == '3.98.2'
+    assert INDEX.next_release(dt.date(2099, 6, 1), '3.99')[1].stage == '3.99.0 final'
+    assert INDEX.next_release(dt.date(2099, 10, 2)) is None
+    assert INDEX.next_release(dt.date(2000, 1, 1), '3.97') is None
+
+
+def test_releases_between() -> None:
+    releases = INDEX.releases_between(dt.date(2098, 12, 1), dt.date(2099, 10, 1))
+
+    assert [release.stage for _, release in releases] == [
+        '3.98.1',
+        '3.99.0 beta 1',
+        '3.98.2',
+        '3.99.0 final',
+    ]
@@ -0,0 +1,83 @@
+import datetime as dt
+import os
+
+import pytest
+
+import release_management
+
+TOML = """\
+[metadata."3.99"]
+pep = 9999
+status = "feature"
+branch = "main"
+release-manager = "Release Manager"
+start-of-development = 2099-01-01
+feature-freeze = 2100-01-01
+first-release = 2100-10-01
+end-of-bugfix = 2102-10-01
+end-of-life = 2105-10-01
+
+[[release."3.99"]]
+stage = "3.99.0 alpha 1"
+state = "expected"
+date = 2099-10-01
+"""
+
+
+def _setup(tmp_path, monkeypatch):
+    toml_path = tmp_path / 'python-releases.toml'
+    toml_path.write_text(TOML, encoding='utf-8')
+    monkeypatch.setattr(release_management, 'RELEASES_TOML', toml_path)
+    monkeypatch.setattr(release_management, 'RELEASES_CACHE_DIR', tmp_path / 'cache')
+    monkeypatch.setattr(release_management, '_loaded', None)
+    return toml_path
+
+
+def test_load_python_releases(tmp_path, monkeypatch) -> None:
+    _setup(tmp_path, monkeypatch)
+
+    python_releases = release_management.load_python_releases()
+
+    assert python_releases.metadata['3.99'].end_of_life == dt.date(2105, 10, 1)
+    assert python_releases.releases['3.99'][0].stage == '3.99.0 alpha 1'
+    assert release_management.load_python_releases() is python_releases
+
+
+def test_load_python_releases_cached(tmp_path, monkeypatch) -> None:
+    _setup(tmp_path, monkeypatch)
+    python_releases = release_management.load_python_releases()
+    assert len(list(tmp_path.glob('cache/*.pickle'))) == 1
+
+    # A new process loads the cache, without parsing the TOML
+    monkeypatch.setattr(release_management, '_loaded', None)
+    monkeypatch.setattr(release_management.tomllib, 'loads', None)
+    assert release_management.load_python_releases() == python_releases
+
+
+def test_load_python_releases_modified(tmp_path, monkeypatch) -> None:
+    toml_path = _setup(tmp_path, monkeypatch)
+    release_management.load_python_releases()
+
+    # The same size and modification time, but different contents
+    stat = toml_path.stat()
+    toml_path.write_text(TOML.replace('2099-10-01', '2099-11-01'), encoding='utf-8')
+    os.utime(toml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    python_releases = release_management.load_python_releases()
+    assert python_releases.releases['3.99'][0].date == dt.date(2099, 11, 1)
+    # The stale cache is removed
+    assert len(list(tmp_path.glob('cache/*.pickle'))) == 1
+
+
+def test_load_python_releases_read_only(tmp_path, monkeypatch) -> None:
+    _setup(tmp_path, monkeypatch)
+    python_releases = release_management.load_python_releases()
+
+    with pytest.raises(TypeError):
+        python_releases.metadata['3.99'] = None
+    with pytest.raises(AttributeError):
+        python_releases.releases['3.99'].append(None)
+    assert (
+        release_management.load_python_releases().releases['3.99'][0].stage
+        == '3.99.0 alpha 1'
+    )
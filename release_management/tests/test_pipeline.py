@@ -0,0 +1,35 @@
+import release_management
+from release_management import pipeline, serialize
+
+
+def test_write_artifacts(tmp_path) -> None:
+    unchanged = tmp_path / 'unchanged.json'
+    unchanged.write_bytes(b'{}\n')
+    changed = tmp_path / 'changed.json'
+    changed.write_bytes(b'{}\n')
+    new = tmp_path / 'new.ics'
+    unchanged_mtime = unchanged.stat().st_mtime_ns
+
+    written = release_management.write_artifacts([
+        (unchanged, b'{}\n'),
+        (changed, b'{"3.99": {}}\n'),
+        (new, b'BEGIN:VCALENDAR\r\n'),
+    ])
+
+    assert written == [changed, new]
+    assert unchanged.stat().st_mtime_ns == unchanged_mtime
+    assert changed.read_bytes() == b'{"3.99": {}}\n'
+    assert new.read_bytes() == b'BEGIN:VCALENDAR\r\n'
+
+
+def test_create_artifacts() -> None:
+    artifacts = dict(pipeline.create_artifacts())
+
+    names = {path.name for path in artifacts}
+    assert {'python-releases.json', 'release-cycle.json'} <= names
+    # with the calendars, rather than in the repository root
+    assert {path.parent for path in artifacts if path.suffix == '.json'} == {
+        serialize.OUTPUT_DIR
+    }
+    assert 'pep-0745.rst' in names
+    assert all(isinstance(contents, bytes) for contents in artifacts.values())
@@ -10,9 +10,11 @@ FAKE_RELEASE = ReleaseInfo(
 )
 
 
-def test_create_release_calendar_has_calendar_metadata() -> None:
+def test_create_release_calendar_has_calendar_metadata(tmp_path) -> None:
     # Act
-    cal_lines = serialize.create_release_schedule_calendar().split('\r\n')
+    serialize.write_release_calendars(tmp_path)
+    calendar_path = tmp_path / 'release-schedule.ics'
+    cal_lines = calendar_path.read_bytes().decode('utf-8').split('\r\n')
 
     # Assert
 
@@ -33,7 +35,7 @@ def test_create_release_calendar_has_calendar_metadata() -> None:
 def test_create_release_calendar_first_event() -> None:
     # Act
     releases = [(9999, FAKE_RELEASE)]
-    cal_lines = serialize.release_schedule_calendar_lines(releases)
+    cal_lines = list(serialize.release_schedule_calendar_lines(releases))
 
     # Assert
     assert cal_lines[5] == 'BEGIN:VEVENT'
@@ -47,3 +49,85 @@ def test_create_release_calendar_first_event() -> None:
     )
     assert cal_lines[11] == 'URL:https://peps.python.org/pep-9999/'
     assert cal_lines[12] == 'END:VEVENT'
+
+
+def test_per_version_calendars(tmp_path) -> None:
+    # Act
+    serialize.write_release_calendars(tmp_path)
+
+    # Assert
+    cal_text = (tmp_path / 'release-schedule-3.14.ics').read_bytes().decode('utf-8')
+    assert 'X-WR-CALNAME:Python 3.14 release schedule\r\n' in cal_text
+    assert 'SUMMARY:Python 3.14.0 final\r\n' in cal_text
+    assert 'SUMMARY:Python 3.13' not in cal_text
+
+
+def test_write_release_calendars_unchanged(tmp_path) -> None:
+    # Arrange
+    first_stamp = dt.datetime(2000, 1, 1, tzinfo=dt.timezone.utc)
+    assert serialize.write_release_calendars(tmp_path, dtstamp=first_stamp)
+
+    # Act
+    changed = serialize.write_release_calendars(tmp_path, dtstamp=first_stamp)
+
+    # Assert
+    assert changed == []
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_write_release_calendars_new_stamp(tmp_path) -> None:
+    # Arrange
+    first_stamp = dt.datetime(2000, 1, 1, tzinfo=dt.timezone.utc)
+    serialize.write_release_calendars(tmp_path, dtstamp=first_stamp)
+    calendar_path = tmp_path / 'release-schedule.ics'
+
+    # Act
+    second_stamp = dt.datetime(2000, 1, 2, tzinfo=dt.timezone.utc)
+    changed = serialize.write_release_calendars(tmp_path, dtstamp=second_stamp)
+
+    # Assert
+    assert calendar_path in changed
+    assert 'DTSTAMP:20000102T000000Z' in calendar_path.read_bytes().decode('utf-8')
+
+
+def test_write_release_calendars_removes_stale(tmp_path) -> None:
+    # Arrange
+    (tmp_path / 'release-schedule-1.0.ics').write_bytes(b'BEGIN:VCALENDAR\r\n')
+    (tmp_path / 'other.ics').write_bytes(b'BEGIN:VCALENDAR\r\n')
+
+    # Act
+    serialize.write_release_calendars(tmp_path / 'calendars')
+    serialize.write_release_calendars(tmp_path)
+
+    # Assert
+    assert (tmp_path / 'calendars' / 'release-schedule-3.14.ics').is_file()
+    assert (tmp_path / 'release-schedule-3.14.ics').is_file()
+    assert not (tmp_path / 'release-schedule-1.0.ics').exists()
+    assert (tmp_path / 'other.ics').is_file()
+
+
+def test_fold_calendar_line() -> None:
+    # Short lines are not folded
+    assert serialize.fold_calendar_line('SUMMARY:Python 3.14.0') == (
+        b'SUMMARY:Python 3.14.0\r\n'
+    )
+
+    # Long lines are folded into lines of at most 75 octets
+    folded = serialize.fold_calendar_line('DESCRIPTION:' + 'x' * 200)
+    lines = folded.split(b'\r\n')
+    assert lines[-1] == b''
+    assert [len(line) for line in lines[:-1]] == [75, 75, 64]
+    assert all(line.startswith(b' ') for line in lines[1:-1])
+    assert folded.replace(b'\r\n ', b'') == b'DESCRIPTION:' + b'x' * 200 + b'\r\n'
+
+
+def test_fold_calendar_line_multi_octet() -> None:
+    # Act
+    folded = serialize.fold_calendar_line('DESCRIPTION:' + 'é' * 40)
+
+    # Assert
+    first, second, _ = folded.split(b'\r\n')
+    # 'é' is two octets, so the first line stops short of 75 octets
+    assert len(first) == 74
+    assert first.decode('utf-8') == 'DESCRIPTION:' + 'é' * 31
+    assert second.decode('utf-8') == ' ' + 'é' * 9
@@ -0,0 +1,59 @@
+import datetime as dt
+import subprocess
+
+import pytest
+
+import release_management
+
+
+@pytest.fixture(autouse=True)
+def _clear_source_date():
+    release_management.source_date.cache_clear()
+    yield
+    release_management.source_date.cache_clear()
+
+
+def test_source_date_epoch(monkeypatch) -> None:
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '1700000000')
+
+    assert release_management.source_date() == dt.datetime(
+        2023, 11, 14, 22, 13, 20, tzinfo=dt.timezone.utc
+    )
+
+
+def test_source_date_head_commit(monkeypatch) -> None:
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    head_time = subprocess.run(
+        ('git', 'log', '-1', '--format=%ct'),
+        cwd=release_management.ROOT_DIR,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    if not head_time:
+        pytest.skip('not a git checkout')
+
+    source_date = release_management.source_date()
+    assert source_date.timestamp() == int(head_time)
+    assert source_date.tzinfo is dt.timezone.utc
+
+
+def test_source_date_epoch_empty(monkeypatch) -> None:
+    # An empty value is treated as unset, so the HEAD commit time is used
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '')
+    monkeypatch.setattr(
+        release_management.subprocess,
+        'run',
+        lambda args, **kwargs: subprocess.CompletedProcess(args, 0, '1700000000\n'),
+    )
+
+    assert release_management.source_date() == dt.datetime(
+        2023, 11, 14, 22, 13, 20, tzinfo=dt.timezone.utc
+    )
+
+
+@pytest.mark.parametrize('epoch', ['yesterday', '1.5', '1' * 30])
+def test_source_date_invalid(monkeypatch, epoch) -> None:
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', epoch)
+
+    with pytest.raises(ValueError, match='SOURCE_DATE_EPOCH must be an integer'):
+        release_management.source_date()
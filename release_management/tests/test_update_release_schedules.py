@@ -0,0 +1,39 @@
+from release_management import update_release_schedules
+
+
+def _setup(tmp_path, monkeypatch):
+    current = tmp_path / 'pep-9998.rst'
+    current.write_bytes(b'Schedule\n')
+    outdated = tmp_path / 'pep-9999.rst'
+    outdated.write_bytes(b'Old schedule\n')
+    sources = [(current, b'Schedule\n'), (outdated, b'New schedule\n')]
+    monkeypatch.setattr(update_release_schedules, 'ROOT_DIR', tmp_path)
+    monkeypatch.setattr(
+        update_release_schedules, 'create_pep_sources', lambda: iter(sources)
+    )
+    return current, outdated
+
+
+def test_update_peps(tmp_path, monkeypatch) -> None:
+    current, outdated = _setup(tmp_path, monkeypatch)
+    current_mtime = current.stat().st_mtime_ns
+
+    assert update_release_schedules.update_peps() == 0
+
+    assert current.stat().st_mtime_ns == current_mtime
+    assert outdated.read_bytes() == b'New schedule\n'
+
+
+def test_update_peps_check(tmp_path, monkeypatch, capsys) -> None:
+    _current, outdated = _setup(tmp_path, monkeypatch)
+
+    assert update_release_schedules.update_peps(check=True) == 1
+
+    assert outdated.read_bytes() == b'Old schedule\n'
+    assert capsys.readouterr().out == (
+        '--- a/pep-9999.rst\n'
+        '+++ b/pep-9999.rst\n'
+        '@@ -1 +1 @@\n'
+        '-Old schedule\n'
+        '+New schedule\n'
+    )
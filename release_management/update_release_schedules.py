@@ -21,26 +21,39 @@ Usage:
     $ python -m release_management update-peps
     $ # or
     $ make regen-all
+
+Only PEPs whose schedules changed are written. To check that the PEPs are up
+to date without writing, printing a diff of any that are not:
+
+    $ python -m release_management update-peps --check
+    $ # or
+    $ make check-regen
 """
 
 from __future__ import annotations
 
 import datetime as dt
+import difflib
+import sys
 
 from release_management import (
     PEP_ROOT,
+    ROOT_DIR,
     ReleaseInfo,
     VersionMetadata,
     load_python_releases,
+    source_date,
+    write_artifacts,
 )
 
 TYPE_CHECKING = False
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
 
     from release_management import ReleaseSchedules, ReleaseState, VersionMetadata
 
-TODAY = dt.date.today()
+TODAY = source_date().date()
 
 SKIPPED_VERSIONS = frozenset({
     '1.6',
@@ -63,7 +76,43 @@ SKIPPED_VERSIONS = frozenset({
 })
 
 
-def update_peps() -> None:
+def update_peps(*, check: bool = False) -> int:
+    """Regenerate the release schedules, writing only the PEPs that changed.
+
+    With ``check``, print a diff of the outdated PEPs instead of writing,
+    and return non-zero if there are any.
+    """
+    outdated = [
+        (pep_path, pep_source)
+        for pep_path, pep_source in create_pep_sources()
+        if pep_path.read_bytes() != pep_source
+    ]
+    if not check:
+        write_artifacts(outdated)
+        return 0
+
+    for pep_path, pep_source in outdated:
+        name = pep_path.relative_to(ROOT_DIR).as_posix()
+        sys.stdout.writelines(
+            difflib.unified_diff(
+                pep_path.read_text(encoding='utf-8').splitlines(keepends=True),
+                pep_source.decode('utf-8').splitlines(keepends=True),
+                fromfile=f'a/{name}',
+                tofile=f'b/{name}',
+            )
+        )
+    if outdated:
+        print(
+            f'{len(outdated)} release schedule PEP(s) are out of date, '
+            'run "python -m release_management update-peps"',
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+def create_pep_sources() -> Iterator[tuple[Path, bytes]]:
+    """Yield the path and regenerated source of each release schedule PEP."""
     python_releases = load_python_releases()
     for version, metadata in python_releases.metadata.items():
         if version in SKIPPED_VERSIONS:
@@ -74,12 +123,13 @@ def update_peps() -> None:
             metadata.start_of_development,
             metadata.end_of_bugfix,
         )
-        update_pep(metadata, schedules)
+        pep_path = PEP_ROOT.joinpath(f'pep-{metadata.pep:0>4}.rst')
+        yield pep_path, render_pep(pep_path, metadata, schedules)
 
 
 def create_schedules(
     version: str,
-    releases: list[ReleaseInfo],
+    releases: Sequence[ReleaseInfo],
     start_of_development: dt.date,
     bugfix_ends: dt.date,
 ) -> ReleaseSchedules:
@@ -113,8 +163,9 @@ def create_schedules(
     return schedules
 
 
-def update_pep(metadata: VersionMetadata, schedules: ReleaseSchedules) -> None:
-    pep_path = PEP_ROOT.joinpath(f'pep-{metadata.pep:0>4}.rst')
+def render_pep(
+    pep_path: Path, metadata: VersionMetadata, schedules: ReleaseSchedules
+) -> bytes:
     pep_lines = iter(pep_path.read_text(encoding='utf-8').splitlines())
     output_lines: list[str] = []
     schedule_name = ''
@@ -143,8 +194,7 @@ def update_pep(metadata: VersionMetadata, schedules: ReleaseSchedules) -> None:
         raise ValueError('No schedule markers found!')
 
     output_lines.append('')  # trailing newline
-    with open(pep_path, 'wb') as f:
-        f.write(b'\n'.join(line.encode('utf-8') for line in output_lines))
+    return '\n'.join(output_lines).encode('utf-8')
 
 
 def generate_schedule_lists(
@@ -176,4 +226,4 @@ def generate_schedule_lists(
 
 
 if __name__ == '__main__':
-    update_peps()
+    raise SystemExit(update_peps())